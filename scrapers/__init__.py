@@ -1,8 +1,8 @@
 # PokeUK DealScout - Data Scrapers
-from .base import BaseScraper, RawListing, ScraperResult
+from .base import BaseScraper, RawListing, RawListingBatch, ScraperResult
 from .ebay_uk import EbayUKScraper, create_ebay_scraper
 from .pokemon_tcg_api import PokemonTCGClient, CardData, SetData, create_pokemon_tcg_client
-from .sync_cards import CardSyncService, POPULAR_SETS
+from .sync_cards import CardSyncService, ProcessedCard, ProcessedSet, POPULAR_SETS
 from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE
 from .cardmarket import CardmarketScraper, create_cardmarket_scraper
 from .vinted import VintedScraper, create_vinted_scraper
@@ -15,6 +15,7 @@ __all__ = [
     # Base
     "BaseScraper",
     "RawListing",
+    "RawListingBatch",
     "ScraperResult",
     # Playwright Base
     "PlaywrightScraper",
@@ -29,6 +30,8 @@ __all__ = [
     "create_pokemon_tcg_client",
     # Sync
     "CardSyncService",
+    "ProcessedCard",
+    "ProcessedSet",
     "POPULAR_SETS",
     # Cardmarket
     "CardmarketScraper",
@@ -5,15 +5,35 @@ All scrapers inherit from BaseScraper to ensure consistent
 interface and behavior.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, UTC
-from typing import Optional, Any
+from typing import Iterator, Optional, Any
 import asyncio
 import logging
+import sys
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a low-cardinality string taken from scraped data.
+
+    Values such as currency codes and conditions repeat on every listing;
+    interning makes them share one object. None passes through.
+    """
+    return sys.intern(value) if value else value
+
+
+# Typical UK shipping cost per platform, used when a listing doesn't state one
+DEFAULT_SHIPPING_COST = {
+    "cardmarket": 1.20,
+    "vinted": 2.50,
+}
+
+
 @dataclass
 class RawListing:
     """
@@ -50,6 +70,76 @@ class RawListing:
             "found_at": self.found_at.isoformat(),
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the to_dict() fields to JSON bytes with orjson."""
+        return orjson.dumps({
+            "external_id": self.external_id,
+            "platform": self.platform,
+            "url": self.url,
+            "title": self.title,
+            "listing_price": self.listing_price,
+            "currency": self.currency,
+            "shipping_cost": self.shipping_cost,
+            "condition": self.condition,
+            "seller_name": self.seller_name,
+            "image_url": self.image_url,
+            "is_buy_now": self.is_buy_now,
+            "found_at": self.found_at,  # orjson writes the same ISO 8601 form
+        })
+
+
+class RawListingBatch:
+    """
+    Columnar store for many listings.
+
+    Each RawListing field is kept as its own list (``batch.listing_price``,
+    ``batch.external_id``, ...), so a page of results costs one list per
+    column rather than one object per row. Rows are materialized as
+    RawListing only when indexed or iterated.
+    """
+
+    COLUMNS = tuple(f.name for f in fields(RawListing))
+    _COLUMN_SET = frozenset(COLUMNS)
+    __slots__ = COLUMNS
+
+    def __init__(self):
+        for column in self.COLUMNS:
+            setattr(self, column, [])
+
+    @classmethod
+    def from_listings(cls, listings: list[RawListing]) -> "RawListingBatch":
+        batch = cls()
+        for listing in listings:
+            batch.append(listing)
+        return batch
+
+    def append(self, listing: RawListing) -> None:
+        for column in self.COLUMNS:
+            getattr(self, column).append(getattr(listing, column))
+
+    def append_row(self, **values: Any) -> None:
+        """Append one row given as RawListing field values by name."""
+        if values.keys() != self._COLUMN_SET:
+            raise TypeError(
+                f"append_row() needs exactly the RawListing fields, got {sorted(values)}"
+            )
+        for column in self.COLUMNS:
+            getattr(self, column).append(values[column])
+
+    def __len__(self) -> int:
+        return len(self.external_id)
+
+    def __getitem__(self, index: int) -> RawListing:
+        return RawListing(**{column: getattr(self, column)[index] for column in self.COLUMNS})
+
+    def __iter__(self) -> Iterator[RawListing]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def columns(self) -> dict[str, list]:
+        """Return the column lists keyed by field name (not copied)."""
+        return {column: getattr(self, column) for column in self.COLUMNS}
+
 
 @dataclass
 class ScraperResult:
@@ -105,12 +195,15 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """
         Parse raw API/HTML data into a RawListing.
 
         Args:
             raw_data: Raw data from API or scrape
+            found_at: Shared timestamp for a page of listings (defaults to now)
 
         Returns:
             RawListing or None if parsing fails
@@ -8,16 +8,39 @@ Cardmarket is one of the largest European TCG marketplaces.
 """
 import re
 from datetime import datetime, UTC
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlencode, quote
 
 from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE
-from .base import RawListing
+from .base import DEFAULT_SHIPPING_COST, RawListing, intern_str
 
 if PLAYWRIGHT_AVAILABLE:
     from playwright.async_api import Page
 
 
+# Currency symbols and whitespace stripped before float conversion
+_PRICE_STRIP_RE = re.compile(r'[£€$\s]')
+
+
+# Listing pages repeat the same price strings, so parsed values are memoized
+@lru_cache(maxsize=1024)
+def _parse_price_text(price_text: Optional[str]) -> Optional[float]:
+    """Parse price from text like '£12.50' or '12,50 €'."""
+    if not price_text:
+        return None
+
+    # Remove currency symbols and whitespace
+    cleaned = _PRICE_STRIP_RE.sub('', price_text)
+    # Handle European decimal format (comma)
+    cleaned = cleaned.replace(',', '.')
+
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
 class CardmarketScraper(PlaywrightScraper):
     """
     Scraper for Cardmarket Pokemon TCG listings.
@@ -177,18 +200,7 @@ class CardmarketScraper(PlaywrightScraper):
 
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from text like '£12.50' or '12,50 €'."""
-        if not price_text:
-            return None
-
-        # Remove currency symbols and whitespace
-        cleaned = re.sub(r'[£€$\s]', '', price_text)
-        # Handle European decimal format (comma)
-        cleaned = cleaned.replace(',', '.')
-
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+        return _parse_price_text(price_text)
 
     def _parse_condition(self, condition_text: str) -> Optional[str]:
         """Parse condition from Cardmarket format."""
@@ -204,7 +216,9 @@ class CardmarketScraper(PlaywrightScraper):
 
         return "NM"  # Default to NM
 
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """Convert raw scraped data to RawListing."""
         try:
             url = raw_data.get("url", "")
@@ -223,11 +237,12 @@ class CardmarketScraper(PlaywrightScraper):
                 title=raw_data.get("title", "Unknown"),
                 listing_price=raw_data.get("price", 0),
                 currency="EUR",  # Cardmarket uses EUR
-                shipping_cost=1.20,  # Typical Cardmarket UK shipping
-                condition=raw_data.get("condition"),
+                shipping_cost=DEFAULT_SHIPPING_COST["cardmarket"],
+                condition=intern_str(raw_data.get("condition")),
                 seller_name=raw_data.get("seller_name"),
                 image_url=raw_data.get("image_url"),
                 is_buy_now=True,
+                found_at=found_at or datetime.now(UTC),
                 raw_data=raw_data,
             )
 
@@ -294,8 +309,9 @@ class CardmarketScraper(PlaywrightScraper):
                     for page_num in range(max_pages):
                         raw_listings = await self._extract_listings_from_page(page)
 
+                        found_at = datetime.now(UTC)
                         for raw in raw_listings:
-                            listing = self.parse_listing(raw)
+                            listing = self.parse_listing(raw, found_at)
                             if listing and listing.external_id not in all_listings:
                                 all_listings[listing.external_id] = listing
 
@@ -16,6 +16,7 @@ from urllib.parse import urlencode
 
 from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE
 from .base import RawListing
+from .http_cache import ConditionalCache
 
 if PLAYWRIGHT_AVAILABLE:
     from playwright.async_api import Page
@@ -42,6 +43,7 @@ class ChaosCardsScraper(PlaywrightScraper):
         request_delay_ms: int = 2000,
         max_retries: int = 3,
         screenshot_dir: Optional[str] = None,
+        http_cache_path: Optional[str] = None,
     ):
         super().__init__(
             name="chaoscards",
@@ -51,6 +53,12 @@ class ChaosCardsScraper(PlaywrightScraper):
             max_retries=max_retries,
             screenshot_dir=screenshot_dir,
         )
+        if http_cache_path:
+            self.http_cache = ConditionalCache(http_cache_path, proxy_url)
+
+        # Listings from the last run per category URL, reused when the
+        # page revalidates as unchanged
+        self._category_listings: dict[str, list[RawListing]] = {}
 
     def _build_search_url(
         self,
@@ -211,7 +219,9 @@ class ChaosCardsScraper(PlaywrightScraper):
 
         return None
 
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """Convert raw product data to RawListing."""
         try:
             external_id = raw_data.get("external_id", "")
@@ -236,6 +246,7 @@ class ChaosCardsScraper(PlaywrightScraper):
                 seller_name="Chaos Cards",
                 image_url=raw_data.get("image_url"),
                 is_buy_now=True,
+                found_at=found_at or datetime.now(UTC),
                 raw_data=raw_data,
             )
 
@@ -308,16 +319,35 @@ class ChaosCardsScraper(PlaywrightScraper):
         if include_sale and "sale/pokemon" not in target_categories:
             target_categories.append("sale/pokemon")
 
-        try:
-            page = await self._get_page()
+        page = None
 
+        try:
             # Scrape categories
             for category in target_categories:
-                self.logger.info(f"Scraping Chaos Cards: {category}")
-
                 url = self._build_search_url(category=category)
 
+                # Skip the browser entirely if the page hasn't changed. Only
+                # the first page is revalidated; later pages are assumed to
+                # change along with it.
+                if self.http_cache and await self.http_cache.is_unchanged(url):
+                    cached = self._category_listings.get(url)
+                    if cached is not None:
+                        self.logger.info(f"Unchanged since last run: {category}")
+                        for listing in cached:
+                            if min_price <= listing.listing_price <= max_price:
+                                all_listings.setdefault(listing.external_id, listing)
+                        continue
+                elif self.http_cache:
+                    # Changed (or unknown): the previous listings are stale
+                    self._category_listings.pop(url, None)
+
+                self.logger.info(f"Scraping Chaos Cards: {category}")
+                category_listings: list[RawListing] = []
+
                 try:
+                    if page is None:
+                        page = await self._get_page()
+
                     await page.goto(url, wait_until="domcontentloaded")
                     await self._handle_popups(page)
 
@@ -328,15 +358,20 @@ class ChaosCardsScraper(PlaywrightScraper):
                     # Scrape pages
                     for page_num in range(max_pages):
                         raw_listings = await self._extract_listings_from_page(page)
+                        found_at = datetime.now(UTC)
 
                         for raw in raw_listings:
+                            listing = self.parse_listing(raw, found_at)
+                            if not listing:
+                                continue
+                            category_listings.append(listing)
+
                             # Price filtering
                             price = raw.get("price", 0)
                             if price < min_price or price > max_price:
                                 continue
 
-                            listing = self.parse_listing(raw)
-                            if listing and listing.external_id not in all_listings:
+                            if listing.external_id not in all_listings:
                                 all_listings[listing.external_id] = listing
 
                         # Next page
@@ -357,6 +392,10 @@ class ChaosCardsScraper(PlaywrightScraper):
                         await self.delay()
                         await page.wait_for_load_state("domcontentloaded")
 
+                    self._category_listings[url] = category_listings
+                    if self.http_cache:
+                        await self.http_cache.commit(url)
+
                 except Exception as e:
                     self.logger.error(f"Failed to scrape {category}: {e}")
                     continue
@@ -371,17 +410,21 @@ class ChaosCardsScraper(PlaywrightScraper):
                     url = self._build_search_url(query=term)
 
                     try:
+                        if page is None:
+                            page = await self._get_page()
+
                         await page.goto(url, wait_until="domcontentloaded")
                         await self._handle_popups(page)
 
                         raw_listings = await self._extract_listings_from_page(page)
+                        found_at = datetime.now(UTC)
 
                         for raw in raw_listings:
                             price = raw.get("price", 0)
                             if price < min_price or price > max_price:
                                 continue
 
-                            listing = self.parse_listing(raw)
+                            listing = self.parse_listing(raw, found_at)
                             if listing and listing.external_id not in all_listings:
                                 all_listings[listing.external_id] = listing
 
@@ -401,6 +444,7 @@ def create_chaoscards_scraper(
     headless: bool = True,
     proxy_url: str = "",
     request_delay_ms: int = 2000,
+    http_cache_path: str = "",
 ) -> ChaosCardsScraper:
     """Factory function to create a Chaos Cards scraper."""
     import os
@@ -409,4 +453,5 @@ def create_chaoscards_scraper(
         headless=headless,
         proxy_url=proxy_url or os.getenv("PROXY_SERVICE_URL", ""),
         request_delay_ms=request_delay_ms,
+        http_cache_path=http_cache_path or None,
     )
@@ -13,7 +13,8 @@ from typing import Optional
 from urllib.parse import urlencode
 import re
 
-from .base import BaseScraper, RawListing
+from .base import BaseScraper, RawListing, RawListingBatch, intern_str
+from .json_utils import loads, new_parser
 
 
 class EbayUKScraper(BaseScraper):
@@ -63,6 +64,8 @@ class EbayUKScraper(BaseScraper):
         self.oauth_token = oauth_token
         self.refresh_token = refresh_token
         self._client: Optional[httpx.AsyncClient] = None
+        # Reused for every Browse response (None without simdjson)
+        self._parser = new_parser()
 
     def is_configured(self) -> bool:
         """Check if eBay credentials are configured."""
@@ -192,20 +195,45 @@ class EbayUKScraper(BaseScraper):
             )
 
         response.raise_for_status()
-        data = response.json()
+        return self._parse_response(response.content)
 
+    def _parse_response(self, body: bytes) -> list[dict]:
+        """
+        Decode a Browse API search response body.
+
+        Args:
+            body: Raw response bytes
+
+        Returns:
+            List of raw item summaries
+        """
+        data = loads(body, self._parser)
         return data.get("itemSummaries", [])
 
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """
         Parse eBay item summary into RawListing.
 
         Args:
             raw_data: Item summary from Browse API
+            found_at: Shared timestamp for the page (defaults to now)
 
         Returns:
             RawListing or None if parsing fails
         """
+        fields = self._item_fields(raw_data, found_at or datetime.now(UTC))
+        return RawListing(**fields) if fields else None
+
+    def _item_fields(self, raw_data: dict, found_at: datetime) -> Optional[dict]:
+        """
+        Extract an item summary's RawListing fields.
+
+        Returns:
+            Field values keyed by RawListing field name, or None if
+            parsing fails
+        """
         try:
             # Extract item ID from URL or itemId field
             item_id = raw_data.get("itemId", "")
@@ -251,25 +279,54 @@ class EbayUKScraper(BaseScraper):
             # Build listing URL
             item_web_url = raw_data.get("itemWebUrl", f"https://www.ebay.co.uk/itm/{item_id}")
 
-            return RawListing(
-                external_id=item_id,
-                platform="ebay",
-                url=item_web_url,
-                title=raw_data.get("title", "Unknown"),
-                listing_price=listing_price,
-                currency=price_data.get("currency", "GBP"),
-                shipping_cost=shipping_cost,
-                condition=condition,
-                seller_name=seller_name,
-                image_url=image_url,
-                is_buy_now=True,
-                raw_data=raw_data,
-            )
+            return {
+                "external_id": item_id,
+                "platform": "ebay",
+                "url": item_web_url,
+                "title": raw_data.get("title", "Unknown"),
+                "listing_price": listing_price,
+                "currency": intern_str(price_data.get("currency", "GBP")),
+                "shipping_cost": shipping_cost,
+                "condition": intern_str(condition),
+                "seller_name": seller_name,
+                "image_url": image_url,
+                "is_buy_now": True,
+                "found_at": found_at,
+                "raw_data": raw_data,
+            }
 
         except Exception as e:
             self.logger.warning(f"Failed to parse listing: {e}")
             return None
 
+    def parse_batch(self, items: list[dict]) -> RawListingBatch:
+        """
+        Parse a page of item summaries into a columnar batch.
+
+        Fields go straight into the batch columns, without building a
+        RawListing per item. Items that fail to parse are skipped, as
+        with parse_listing. All rows share one found_at timestamp.
+        """
+        batch = RawListingBatch()
+        found_at = datetime.now(UTC)
+        for item in items:
+            fields = self._item_fields(item, found_at)
+            if fields:
+                batch.append_row(**fields)
+        return batch
+
+    def parse_page(self, body: bytes) -> RawListingBatch:
+        """
+        Decode a raw Browse API response and parse it into a columnar batch.
+
+        Args:
+            body: Raw search response bytes
+
+        Returns:
+            RawListingBatch of the page's parseable items
+        """
+        return self.parse_batch(self._parse_response(body))
+
     async def fetch_listings(
         self,
         search_terms: Optional[list[str]] = None,
@@ -306,8 +363,9 @@ class EbayUKScraper(BaseScraper):
                     max_price=max_price,
                 )
 
+                found_at = datetime.now(UTC)
                 for item in raw_items:
-                    listing = self.parse_listing(item)
+                    listing = self.parse_listing(item, found_at)
                     if listing and listing.external_id not in all_listings:
                         all_listings[listing.external_id] = listing
 
@@ -0,0 +1,135 @@
+"""
+Conditional HTTP revalidation cache.
+
+Stores ETag / Last-Modified validators per URL in SQLite so scrapers
+can ask "has this page changed since last run?" with a cheap
+conditional HEAD request before paying for a full browser load.
+"""
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ConditionalCache:
+    """
+    SQLite-backed store of HTTP validators keyed by URL.
+
+    A URL counts as unchanged only when the server answers a
+    conditional request with 304 Not Modified. Anything else
+    (no validators, errors, blocks) is treated as changed.
+
+    Fresh validators from a changed page are held back until the caller
+    confirms it scraped the page with ``commit()``, so a failed scrape
+    can't leave validators pointing at content that was never read.
+    """
+
+    def __init__(self, path: str, proxy_url: Optional[str] = None):
+        self.path = path
+        self.proxy_url = proxy_url
+        self._conn: Optional[sqlite3.Connection] = None
+        # SQLite calls run in worker threads (off the event loop); this
+        # keeps them to one at a time on the shared connection
+        self._db_lock = threading.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Validators seen on changed pages, awaiting commit()
+        self._pending: dict[str, tuple[Optional[str], Optional[str]]] = {}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database lazily."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS validators ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                "fetched_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client used for revalidation."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                proxy=self.proxy_url or None,
+                timeout=15.0,
+                follow_redirects=True,
+            )
+        return self._client
+
+    def get(self, url: str) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """Return stored (etag, last_modified) for a URL, if any."""
+        with self._db_lock:
+            return self._get_conn().execute(
+                "SELECT etag, last_modified FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store validators for a URL."""
+        with self._db_lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO validators (url, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, time.time()),
+            )
+            conn.commit()
+
+    async def is_unchanged(self, url: str) -> bool:
+        """
+        Revalidate a URL against its stored validators.
+
+        Returns:
+            True if the server replied 304 Not Modified
+        """
+        self._pending.pop(url, None)
+        headers = {}
+        stored = await asyncio.to_thread(self.get, url)
+        if stored:
+            etag, last_modified = stored
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await self._get_client().head(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug(f"Revalidation failed for {url}: {e}")
+            return False
+
+        if response.status_code == 304:
+            return True
+
+        if response.is_success:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._pending[url] = (etag, last_modified)
+
+        return False
+
+    async def commit(self, url: str) -> None:
+        """
+        Store the validators from the last revalidation of a URL.
+
+        Call once the page has been scraped successfully.
+        """
+        pending = self._pending.pop(url, None)
+        if pending:
+            await asyncio.to_thread(self.set, url, *pending)
+
+    async def close(self) -> None:
+        """Close the HTTP client and database connection."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,51 @@
+"""
+Fast JSON decoding for API responses.
+
+Uses pysimdjson when it is installed (``pip install pysimdjson``) and
+falls back to orjson otherwise. Either way callers get plain Python
+dicts/lists, so decoded data can outlive the parser that produced it.
+"""
+from typing import Any, Optional
+
+import orjson
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    simdjson = None
+    SIMDJSON_AVAILABLE = False
+
+
+def new_parser() -> Optional["simdjson.Parser"]:
+    """
+    Create a reusable simdjson parser, or None if simdjson isn't installed.
+
+    Reusing one parser across responses keeps its internal buffers
+    allocated between calls. A parser is not safe to share between
+    threads.
+    """
+    return simdjson.Parser() if SIMDJSON_AVAILABLE else None
+
+
+def loads(body: bytes, parser: Optional["simdjson.Parser"] = None) -> Any:
+    """
+    Decode a JSON document to plain Python objects.
+
+    Args:
+        body: Raw JSON bytes (e.g. ``response.content``)
+        parser: Optional parser from new_parser() to reuse
+
+    Returns:
+        Decoded value (dict, list or scalar)
+    """
+    if parser is None:
+        return orjson.loads(body)
+
+    doc = parser.parse(body)
+    # Materialize before the parser is reused, which invalidates proxies
+    if isinstance(doc, simdjson.Object):
+        return doc.as_dict()
+    if isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    return doc
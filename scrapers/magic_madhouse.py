@@ -16,6 +16,7 @@ from urllib.parse import urlencode
 
 from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE
 from .base import RawListing
+from .http_cache import ConditionalCache
 
 if PLAYWRIGHT_AVAILABLE:
     from playwright.async_api import Page
@@ -42,6 +43,7 @@ class MagicMadhouseScraper(PlaywrightScraper):
         request_delay_ms: int = 2000,
         max_retries: int = 3,
         screenshot_dir: Optional[str] = None,
+        http_cache_path: Optional[str] = None,
     ):
         super().__init__(
             name="magicmadhouse",
@@ -51,6 +53,12 @@ class MagicMadhouseScraper(PlaywrightScraper):
             max_retries=max_retries,
             screenshot_dir=screenshot_dir,
         )
+        if http_cache_path:
+            self.http_cache = ConditionalCache(http_cache_path, proxy_url)
+
+        # Listings from the last run per collection URL, reused when the
+        # page revalidates as unchanged
+        self._collection_listings: dict[str, list[RawListing]] = {}
 
     def _build_search_url(
         self,
@@ -200,7 +208,9 @@ class MagicMadhouseScraper(PlaywrightScraper):
 
         return None
 
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """Convert raw product data to RawListing."""
         try:
             external_id = raw_data.get("external_id", "")
@@ -225,6 +235,7 @@ class MagicMadhouseScraper(PlaywrightScraper):
                 seller_name="Magic Madhouse",
                 image_url=raw_data.get("image_url"),
                 is_buy_now=True,
+                found_at=found_at or datetime.now(UTC),
                 raw_data=raw_data,
             )
 
@@ -283,20 +294,38 @@ class MagicMadhouseScraper(PlaywrightScraper):
         if include_sale:
             target_collections.append("pokemon-sale")
 
-        try:
-            page = await self._get_page()
+        page = None
 
+        try:
             # Scrape each collection
             for collection in target_collections:
-                self.logger.info(f"Scraping Magic Madhouse: {collection}")
-
                 url = self._build_search_url(
                     collection=collection,
                     min_price=min_price,
                     max_price=max_price,
                 )
 
+                # Skip the browser entirely if the page hasn't changed. Only
+                # the first page is revalidated; later pages are assumed to
+                # change along with it.
+                if self.http_cache and await self.http_cache.is_unchanged(url):
+                    cached = self._collection_listings.get(url)
+                    if cached is not None:
+                        self.logger.info(f"Unchanged since last run: {collection}")
+                        for listing in cached:
+                            all_listings.setdefault(listing.external_id, listing)
+                        continue
+                elif self.http_cache:
+                    # Changed (or unknown): the previous listings are stale
+                    self._collection_listings.pop(url, None)
+
+                self.logger.info(f"Scraping Magic Madhouse: {collection}")
+                collection_listings: list[RawListing] = []
+
                 try:
+                    if page is None:
+                        page = await self._get_page()
+
                     await page.goto(url, wait_until="domcontentloaded")
                     await self._handle_popups(page)
 
@@ -307,11 +336,14 @@ class MagicMadhouseScraper(PlaywrightScraper):
                     # Scrape pages
                     for page_num in range(max_pages):
                         raw_listings = await self._extract_listings_from_page(page)
+                        found_at = datetime.now(UTC)
 
                         for raw in raw_listings:
-                            listing = self.parse_listing(raw)
-                            if listing and listing.external_id not in all_listings:
-                                all_listings[listing.external_id] = listing
+                            listing = self.parse_listing(raw, found_at)
+                            if listing:
+                                collection_listings.append(listing)
+                                if listing.external_id not in all_listings:
+                                    all_listings[listing.external_id] = listing
 
                         # Try next page
                         next_btn = await page.query_selector("a[rel='next'], .pagination__next, .next-page")
@@ -322,6 +354,10 @@ class MagicMadhouseScraper(PlaywrightScraper):
                         await self.delay()
                         await page.wait_for_load_state("domcontentloaded")
 
+                    self._collection_listings[url] = collection_listings
+                    if self.http_cache:
+                        await self.http_cache.commit(url)
+
                 except Exception as e:
                     self.logger.error(f"Failed to scrape {collection}: {e}")
                     continue
@@ -335,13 +371,17 @@ class MagicMadhouseScraper(PlaywrightScraper):
                     url = f"{self.BASE_URL}/search?q={term}&type=product"
 
                     try:
+                        if page is None:
+                            page = await self._get_page()
+
                         await page.goto(url, wait_until="domcontentloaded")
                         await self._handle_popups(page)
 
                         raw_listings = await self._extract_listings_from_page(page)
+                        found_at = datetime.now(UTC)
 
                         for raw in raw_listings:
-                            listing = self.parse_listing(raw)
+                            listing = self.parse_listing(raw, found_at)
                             if listing and listing.external_id not in all_listings:
                                 all_listings[listing.external_id] = listing
 
@@ -361,6 +401,7 @@ def create_magicmadhouse_scraper(
     headless: bool = True,
     proxy_url: str = "",
     request_delay_ms: int = 2000,
+    http_cache_path: str = "",
 ) -> MagicMadhouseScraper:
     """Factory function to create a Magic Madhouse scraper."""
     import os
@@ -369,4 +410,5 @@ def create_magicmadhouse_scraper(
         headless=headless,
         proxy_url=proxy_url or os.getenv("PROXY_SERVICE_URL", ""),
         request_delay_ms=request_delay_ms,
+        http_cache_path=http_cache_path or None,
     )
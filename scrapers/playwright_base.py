@@ -9,6 +9,7 @@ Provides common functionality for browser automation including:
 """
 import asyncio
 from abc import abstractmethod
+from datetime import datetime
 from typing import Optional
 from pathlib import Path
 import logging
@@ -20,9 +21,17 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 from .base import BaseScraper, RawListing
+from .http_cache import ConditionalCache
 
 logger = logging.getLogger(__name__)
 
+# Desktop Chrome, shared by the browser context and any plain-HTTP requests
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
 
 class PlaywrightScraper(BaseScraper):
     """
@@ -32,6 +41,10 @@ class PlaywrightScraper(BaseScraper):
     anti-detection measures for scraping protected sites.
     """
 
+    # Requests aborted by the browser context; subclasses opt in
+    BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset()
+    BLOCKED_URL_PARTS: tuple[str, ...] = ()
+
     def __init__(
         self,
         name: str,
@@ -53,6 +66,11 @@ class PlaywrightScraper(BaseScraper):
         self._playwright = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
+        # Guards browser start-up when several pages are opened concurrently
+        self._init_lock = asyncio.Lock()
+
+        # Optional page revalidation cache (set by scrapers that use it)
+        self.http_cache: Optional[ConditionalCache] = None
 
     def is_configured(self) -> bool:
         """Check if Playwright is available."""
@@ -79,17 +97,16 @@ class PlaywrightScraper(BaseScraper):
         # Create context with anti-detection settings
         self._context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
+            user_agent=USER_AGENT,
             locale="en-GB",
             timezone_id="Europe/London",
             geolocation={"latitude": 51.5074, "longitude": -0.1278},  # London
             permissions=["geolocation"],
         )
 
+        if self.BLOCKED_RESOURCE_TYPES or self.BLOCKED_URL_PARTS:
+            await self._context.route("**/*", self._route_request)
+
         # Add stealth scripts to avoid detection
         await self._context.add_init_script("""
             // Override navigator.webdriver
@@ -111,10 +128,21 @@ class PlaywrightScraper(BaseScraper):
             );
         """)
 
+    async def _route_request(self, route) -> None:
+        """Abort requests the scraper doesn't need, let the rest through."""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(
+            part in request.url for part in self.BLOCKED_URL_PARTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _get_page(self) -> Page:
         """Get a new page from the browser context."""
-        if not self._context:
-            await self._init_browser()
+        async with self._init_lock:
+            if not self._context:
+                await self._init_browser()
         return await self._context.new_page()
 
     async def _take_screenshot(self, page: Page, name: str) -> Optional[str]:
@@ -153,6 +181,12 @@ class PlaywrightScraper(BaseScraper):
             await self._take_screenshot(page, "cloudflare_blocked")
             return False
 
+    async def __aenter__(self) -> "PlaywrightScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """Close browser and cleanup resources."""
         if self._context:
@@ -167,12 +201,17 @@ class PlaywrightScraper(BaseScraper):
             await self._playwright.stop()
             self._playwright = None
 
+        if self.http_cache:
+            await self.http_cache.close()
+
     @abstractmethod
     async def fetch_listings(self, **kwargs) -> list[RawListing]:
         """Fetch listings - implemented by subclasses."""
         pass
 
     @abstractmethod
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """Parse listing - implemented by subclasses."""
         pass
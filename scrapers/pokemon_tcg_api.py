@@ -15,14 +15,55 @@ API Documentation: https://docs.pokemontcg.io/
 import httpx
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Union
+from urllib.parse import urlencode
 import asyncio
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
+import weakref
+
+import orjson
+
+from .json_utils import loads, new_parser
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing nested objects in API payloads
+_EMPTY = MappingProxyType({})
+
+# TCGPlayer price variants, in order of preference
+_TCGPLAYER_PRICE_TYPES = ("normal", "holofoil", "reverseHolofoil", "1stEditionHolofoil")
+
+
+class _SharedPool:
+    """A pooled HTTP/2 client and the number of API clients using it."""
+    __slots__ = ("client", "users")
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.users = 0
+
+
+# One pool per event loop (an AsyncClient can't move between loops), so
+# paged requests from every PokemonTCGClient reuse a single TLS session.
+_shared_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPool]" = (
+    weakref.WeakKeyDictionary()
+)
 
-@dataclass
+
+async def aclose_shared() -> None:
+    """Close the running loop's shared connection pool, whoever is using it."""
+    pool = _shared_pools.pop(asyncio.get_running_loop(), None)
+    if pool:
+        await pool.client.aclose()
+
+
+@dataclass(slots=True)
 class CardData:
     """Pokemon card data from the API."""
     id: str  # e.g., "base1-4" (set-number)
@@ -64,7 +105,7 @@ class CardData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SetData:
     """Pokemon TCG set data from the API."""
     id: str  # e.g., "base1", "swsh12"
@@ -88,6 +129,94 @@ class SetData:
         }
 
 
+@lru_cache(maxsize=256)
+def _build_card_query(
+    query: str = "",
+    set_id: str = "",
+    name: str = "",
+    rarity: str = "",
+) -> Optional[str]:
+    """Build the Lucene query string for a card search."""
+    q_parts = []
+    if query:
+        q_parts.append(query)
+    if set_id:
+        q_parts.append(f'set.id:"{set_id}"')
+    if name:
+        q_parts.append(f'name:"{name}*"')
+    if rarity:
+        q_parts.append(f'rarity:"{rarity}"')
+
+    return " ".join(q_parts) or None
+
+
+class ResponseCache:
+    """
+    Small SQLite-backed cache for API responses.
+
+    Set contents barely change once released, so repeat sync runs
+    can be served from disk instead of spending API quota.
+
+    The client calls get/set from worker threads so concurrent syncs
+    don't block the event loop on disk; a lock serialises access to
+    the shared connection.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database lazily so constructing a client never touches disk."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[dict] = None) -> str:
+        """Build a stable cache key from endpoint and query params."""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.blake2b(f"{endpoint}?{query}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a cached response, or None if missing/expired."""
+        with self._lock:
+            row = self._get_conn().execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return loads(row[0])
+
+    def set(self, key: str, data: Union[bytes, dict], ttl_seconds: int) -> None:
+        """
+        Store a response for ttl_seconds.
+
+        Pass the raw response body where possible; it is stored as-is
+        rather than re-encoded.
+        """
+        body = data if isinstance(data, bytes) else orjson.dumps(data)
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, expires_at) VALUES (?, ?, ?)",
+                (key, body, time.time() + ttl_seconds),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class PokemonTCGClient:
     """
     Client for the Pokemon TCG API.
@@ -102,70 +231,128 @@ class PokemonTCGClient:
     # With API key: 20,000 requests/day
     DEFAULT_PAGE_SIZE = 250  # Max allowed by API
 
+    # API requests this client has in flight at once, across every set
+    # and page being fetched
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # Response cache lifetimes. Card lists are stable but embed prices,
+    # which the API refreshes daily.
+    CARDS_CACHE_TTL = 86400
+    SETS_CACHE_TTL = 3600
+
     def __init__(
         self,
         api_key: str = "",
         request_delay_ms: int = 100,
+        cache_path: Optional[str] = None,
+        max_concurrent_requests: Optional[int] = None,
     ):
         """
         Initialize the Pokemon TCG API client.
 
         Args:
             api_key: Optional API key for higher rate limits
-            request_delay_ms: Delay between requests in milliseconds
+            request_delay_ms: Delay between requests in milliseconds,
+                per request slot
+            cache_path: Optional SQLite file for caching responses
+            max_concurrent_requests: Request slots shared by every call
+                on this client (defaults to MAX_CONCURRENT_REQUESTS)
         """
         self.api_key = api_key
         self.request_delay_ms = request_delay_ms
-        self._client: Optional[httpx.AsyncClient] = None
+        self.max_concurrent_requests = max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS
+        # Every network request takes a slot, so however many sets and
+        # pages are being fetched, at most this many hit the API at once
+        self._request_sem = asyncio.Semaphore(self.max_concurrent_requests)
+        self._headers = {"X-Api-Key": api_key} if api_key else {}
+        self._cache = ResponseCache(cache_path) if cache_path else None
+        # One parser reused across every page (None without simdjson)
+        self._parser = new_parser()
         self.logger = logging.getLogger("pokemon_tcg_api")
+        # Shared pool this client holds a reference on, if any
+        self._pool: Optional[_SharedPool] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            headers = {"Content-Type": "application/json"}
-            if self.api_key:
-                headers["X-Api-Key"] = self.api_key
-
-            self._client = httpx.AsyncClient(
+        """Get the running loop's shared HTTP client, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        pool = _shared_pools.get(loop)
+        if pool is None or pool.client.is_closed:
+            pool = _shared_pools[loop] = _SharedPool(httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 timeout=30.0,
-                headers=headers,
-            )
-        return self._client
+                headers={"Content-Type": "application/json"},
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            ))
+
+        if self._pool is not pool:
+            self._release_pool()
+            pool.users += 1
+            self._pool = pool
+        return pool.client
+
+    def _release_pool(self) -> Optional[_SharedPool]:
+        """Drop this client's reference; return the pool if it is now unused."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return None
+        pool.users -= 1
+        return pool if pool.users <= 0 else None
 
     async def _request(self, endpoint: str, params: dict = None) -> dict:
         """Make an API request with rate limiting."""
+        cache_key = None
+        if self._cache:
+            cache_key = ResponseCache.make_key(endpoint, params)
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return cached
+
         client = await self._get_client()
 
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
+        async with self._request_sem:
+            response = await client.get(endpoint, params=params, headers=self._headers)
+            response.raise_for_status()
+
+            # Apply rate limit delay, holding the slot so each one issues
+            # at most one request per delay
+            if self.request_delay_ms > 0:
+                await asyncio.sleep(self.request_delay_ms / 1000)
+
+        data = self._decode_response(response.content)
 
-        # Apply rate limit delay
-        if self.request_delay_ms > 0:
-            await asyncio.sleep(self.request_delay_ms / 1000)
+        if cache_key:
+            ttl = self.CARDS_CACHE_TTL if endpoint.startswith("/cards") else self.SETS_CACHE_TTL
+            await asyncio.to_thread(self._cache.set, cache_key, response.content, ttl)
 
-        return response.json()
+        return data
+
+    def _decode_response(self, body: bytes) -> dict:
+        """Decode a response body with the client's reusable parser."""
+        return loads(body, self._parser)
 
     def _parse_card(self, raw: dict) -> CardData:
         """Parse raw API card data into CardData."""
-        images = raw.get("images", {})
-        set_data = raw.get("set", {})
-        tcgplayer = raw.get("tcgplayer", {})
-        cardmarket = raw.get("cardmarket", {})
+        images = raw.get("images") or _EMPTY
+        set_data = raw.get("set") or _EMPTY
+        tcgplayer = raw.get("tcgplayer") or _EMPTY
+        cardmarket = raw.get("cardmarket") or _EMPTY
 
         # Extract prices
-        tcgplayer_prices = tcgplayer.get("prices", {})
-        cardmarket_prices = cardmarket.get("prices", {})
+        tcgplayer_prices = tcgplayer.get("prices") or _EMPTY
+        cardmarket_prices = cardmarket.get("prices") or _EMPTY
 
         # Get the most relevant price (normal, holofoil, etc.)
         tcg_market = None
         tcg_low = None
-        for price_type in ["normal", "holofoil", "reverseHolofoil", "1stEditionHolofoil"]:
-            if price_type in tcgplayer_prices:
-                tcg_market = tcgplayer_prices[price_type].get("market")
-                tcg_low = tcgplayer_prices[price_type].get("low")
-                if tcg_market:
-                    break
+        if tcgplayer_prices:
+            for price_type in _TCGPLAYER_PRICE_TYPES:
+                prices = tcgplayer_prices.get(price_type)
+                if prices is not None:
+                    tcg_market = prices.get("market")
+                    tcg_low = prices.get("low")
+                    if tcg_market:
+                        break
 
         return CardData(
             id=raw.get("id", ""),
@@ -191,7 +378,7 @@ class PokemonTCGClient:
 
     def _parse_set(self, raw: dict) -> SetData:
         """Parse raw API set data into SetData."""
-        images = raw.get("images", {})
+        images = raw.get("images") or _EMPTY
 
         return SetData(
             id=raw.get("id", ""),
@@ -222,6 +409,32 @@ class PokemonTCGClient:
                 return None
             raise
 
+    async def get_cards(self, card_ids: list[str]) -> dict[str, CardData]:
+        """
+        Get many cards by ID using one bulk fetch per set.
+
+        Cheaper than repeated get_card() calls when IDs share sets.
+
+        Args:
+            card_ids: Card IDs (e.g., ["base1-4", "base1-2", "sv1-1"])
+
+        Returns:
+            Dict of card ID to CardData for the IDs that were found
+        """
+        wanted = set(card_ids)
+        set_ids = sorted({card_id.split("-", 1)[0] for card_id in wanted})
+
+        set_cards = await asyncio.gather(
+            *[self.get_all_cards_in_set(set_id) for set_id in set_ids]
+        )
+
+        return {
+            card.id: card
+            for cards in set_cards
+            for card in cards
+            if card.id in wanted
+        }
+
     async def search_cards(
         self,
         query: str = "",
@@ -245,23 +458,22 @@ class PokemonTCGClient:
         Returns:
             Tuple of (cards, total_count)
         """
-        # Build query
-        q_parts = []
-        if query:
-            q_parts.append(query)
-        if set_id:
-            q_parts.append(f'set.id:"{set_id}"')
-        if name:
-            q_parts.append(f'name:"{name}*"')
-        if rarity:
-            q_parts.append(f'rarity:"{rarity}"')
+        q = _build_card_query(query, set_id, name, rarity)
+        return await self._search_page(q, page, page_size)
 
+    async def _search_page(
+        self,
+        q: Optional[str],
+        page: int,
+        page_size: int,
+    ) -> tuple[list[CardData], int]:
+        """Fetch one page of card search results for a prebuilt query."""
         params = {
             "page": page,
             "pageSize": min(page_size, self.DEFAULT_PAGE_SIZE),
         }
-        if q_parts:
-            params["q"] = " ".join(q_parts)
+        if q:
+            params["q"] = q
 
         data = await self._request("/cards", params)
 
@@ -280,24 +492,24 @@ class PokemonTCGClient:
         Returns:
             List of all cards in the set
         """
-        all_cards = []
-        page = 1
-
-        while True:
-            cards, total = await self.search_cards(
-                set_id=set_id,
-                page=page,
-                page_size=self.DEFAULT_PAGE_SIZE,
-            )
-
-            all_cards.extend(cards)
-            self.logger.info(f"Fetched {len(all_cards)}/{total} cards from {set_id}")
-
-            if len(all_cards) >= total:
-                break
-
-            page += 1
-
+        q = _build_card_query(set_id=set_id)
+        page_size = self.DEFAULT_PAGE_SIZE
+
+        # The first page tells us how many pages there are; fetch the rest
+        # concurrently instead of one round trip at a time (bounded by the
+        # client's request slots)
+        all_cards, total = await self._search_page(q, 1, page_size)
+        page_count = -(-total // page_size)
+
+        if page_count > 1:
+            pages = await asyncio.gather(*[
+                self._search_page(q, page, page_size)
+                for page in range(2, page_count + 1)
+            ])
+            for cards, _ in pages:
+                all_cards.extend(cards)
+
+        self.logger.info(f"Fetched {len(all_cards)}/{total} cards from {set_id}")
         return all_cards
 
     async def get_set(self, set_id: str) -> Optional[SetData]:
@@ -390,15 +602,26 @@ class PokemonTCGClient:
         return cards[:limit]
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """
+        Release the shared connection pool and close the response cache.
+
+        The pool itself is closed only when no other client is using it.
+        """
+        unused = self._release_pool()
+        # A pool from another (finished) loop can't be closed from here;
+        # it goes away with its loop
+        loop = asyncio.get_running_loop()
+        if unused and _shared_pools.get(loop) is unused:
+            del _shared_pools[loop]
+            await unused.client.aclose()
+        if self._cache:
+            self._cache.close()
 
 
 def create_pokemon_tcg_client(
     api_key: str = "",
     request_delay_ms: int = 100,
+    cache_path: Optional[str] = None,
 ) -> PokemonTCGClient:
     """
     Factory function to create a Pokemon TCG API client.
@@ -406,13 +629,19 @@ def create_pokemon_tcg_client(
     Args:
         api_key: Optional API key (from env if not provided)
         request_delay_ms: Delay between requests
+        cache_path: Response cache file (from env if not provided,
+            empty string disables caching)
 
     Returns:
         Configured PokemonTCGClient
     """
     import os
 
+    if cache_path is None:
+        cache_path = os.getenv("POKEMON_TCG_CACHE_PATH", ".pokemon_tcg_cache.db")
+
     return PokemonTCGClient(
         api_key=api_key or os.getenv("POKEMON_TCG_API_KEY", ""),
         request_delay_ms=request_delay_ms,
+        cache_path=cache_path or None,
     )
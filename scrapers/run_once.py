@@ -6,6 +6,7 @@ Usage:
     python -m scrapers.run_once
     python -m scrapers.run_once --scrapers ebay,cardmarket
     python -m scrapers.run_once --output results.json
+    python -m scrapers.run_once --output results.ndjson --ndjson
 """
 import asyncio
 import argparse
@@ -13,6 +14,8 @@ import json
 import logging
 from datetime import datetime, UTC
 
+import orjson
+
 from .scheduler import create_scheduler
 
 # Configure logging
@@ -35,6 +38,11 @@ async def main():
         type=str,
         help="Output file for results (JSON)",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write --output as NDJSON: a summary line, then one listing per line",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -66,7 +74,10 @@ async def main():
 
     # Run
     start = datetime.now(UTC)
-    results = await scheduler.run_once()
+    try:
+        results = await scheduler.run_once()
+    finally:
+        await scheduler.close()
     duration = (datetime.now(UTC) - start).total_seconds()
 
     # Summary
@@ -87,16 +98,22 @@ async def main():
 
     # Output to file if specified
     if args.output:
-        output_data = {
+        header = {
             "timestamp": datetime.now(UTC).isoformat(),
             "duration_seconds": duration,
             "total_listings": len(all_listings),
             "results": [r.to_dict() for r in results],
-            "listings": [l.to_dict() for l in all_listings],
         }
 
-        with open(args.output, "w") as f:
-            json.dump(output_data, f, indent=2)
+        with open(args.output, "wb") as f:
+            if args.ndjson:
+                # Streamed, so listings are never held twice in memory
+                f.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+                for listing in all_listings:
+                    f.write(listing.to_json() + b"\n")
+            else:
+                header["listings"] = [l.to_dict() for l in all_listings]
+                f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2))
 
         logger.info(f"\nResults written to: {args.output}")
 
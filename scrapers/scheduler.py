@@ -8,10 +8,17 @@ and stores deals in the database.
 Designed for 60-second refresh cycles as per spec.
 """
 import asyncio
+import heapq
+import json
 import logging
+import os
+import random
+import time
 from datetime import datetime, UTC
+from functools import lru_cache, partial
+from types import SimpleNamespace
 from typing import Optional, Callable, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from .base import RawListing, ScraperResult
 from .proxy_manager import ProxyManager, create_proxy_manager
@@ -26,16 +33,59 @@ from .chaos_cards import create_chaoscards_scraper
 logger = logging.getLogger(__name__)
 
 
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> SimpleNamespace:
+    """
+    Read scheduler settings from the environment once per process.
+
+    Call ``_load_env.cache_clear()`` after changing the environment
+    (e.g. in tests) to pick up new values.
+    """
+    delay_ms = os.getenv("SCRAPER_REQUEST_DELAY_MS")
+    return SimpleNamespace(
+        ebay_enabled=_env_flag("SCRAPER_EBAY_ENABLED", "true"),
+        cardmarket_enabled=_env_flag("SCRAPER_CARDMARKET_ENABLED", "true"),
+        vinted_enabled=_env_flag("SCRAPER_VINTED_ENABLED", "false"),
+        magicmadhouse_enabled=_env_flag("SCRAPER_MAGICMADHOUSE_ENABLED", "true"),
+        chaoscards_enabled=_env_flag("SCRAPER_CHAOSCARDS_ENABLED", "true"),
+        # None when unset, so each source keeps its own default delay
+        delay_ms=int(delay_ms) if delay_ms else None,
+        max_concurrency=int(os.getenv("SCRAPER_MAX_CONCURRENCY", "3")),
+        # Revalidation cache for slow-changing retail pages (unset/empty disables)
+        http_cache_path=os.path.expanduser(os.getenv("SCRAPER_HTTP_CACHE_PATH", "")),
+        # Last-run times persisted across restarts (unset/empty disables)
+        state_path=os.path.expanduser(os.getenv("SCRAPER_STATE_PATH", "")),
+        ebay_app_id=os.getenv("EBAY_APP_ID", ""),
+        ebay_cert_id=os.getenv("EBAY_CERT_ID", ""),
+        ebay_oauth_token=os.getenv("EBAY_OAUTH_TOKEN", ""),
+    )
+
+
+# Upper bound for a backed-off task interval
+MAX_BACKOFF_SECONDS = 3600
+
+
+def _jittered(interval_seconds: float) -> float:
+    """Spread an interval by +/-10% so restarted replicas drift apart."""
+    return interval_seconds * random.uniform(0.9, 1.1)
+
+
 @dataclass
 class ScraperTask:
     """Configuration for a scraper task."""
     name: str
     enabled: bool = True
     interval_seconds: int = 60
-    factory: Callable = None
-    kwargs: dict = field(default_factory=dict)
-    last_run: Optional[datetime] = None
+    factory: Callable[[], Any] = None  # Zero-arg builder, e.g. a functools.partial
+    last_run: Optional[datetime] = None  # Wall clock, for stats and persistence
+    last_run_monotonic: Optional[float] = None  # For scheduling
     last_result: Optional[ScraperResult] = None
+    consecutive_failures: int = 0  # Drives interval backoff
+    instance: Optional[Any] = None  # Scraper reused across runs
 
 
 @dataclass
@@ -67,6 +117,7 @@ class ScraperScheduler:
         proxy_manager: Optional[ProxyManager] = None,
         on_listings_found: Optional[Callable[[list[RawListing]], Any]] = None,
         on_error: Optional[Callable[[str, Exception], Any]] = None,
+        state_path: Optional[str] = None,
     ):
         """
         Initialize the scheduler.
@@ -75,6 +126,8 @@ class ScraperScheduler:
             proxy_manager: Optional proxy manager for scrapers
             on_listings_found: Callback when listings are found
             on_error: Callback when errors occur
+            state_path: JSON file for last-run times (defaults to
+                SCRAPER_STATE_PATH; persistence is off when neither is set)
         """
         self.proxy_manager = proxy_manager or create_proxy_manager()
         self.on_listings_found = on_listings_found
@@ -83,83 +136,199 @@ class ScraperScheduler:
         self.tasks: dict[str, ScraperTask] = {}
         self.stats = SchedulerStats()
         self.running = False
-        self._stop_event = asyncio.Event()
-
-        # Initialize default tasks
+        # Caps how many scrapers run at once (shared proxy pool / event loop)
+        self._run_sem = asyncio.Semaphore(_load_env().max_concurrency)
+        # Set by stop() and whenever the schedule changes, to wake start()
+        self._wake_event = asyncio.Event()
+
+        # Timer heap of (due_at, generation, task_name), on the monotonic
+        # clock. Rescheduling bumps the task's generation, which
+        # invalidates its older entries.
+        self._heap: list[tuple[float, int, str]] = []
+        self._generations: dict[str, int] = {}
+
+        # Scraper runs in progress, cancelled by stop()
+        self._in_flight: list[asyncio.Task] = []
+        # Names of tasks mid-run; run_task reschedules these when it ends
+        self._running_tasks: set[str] = set()
+
+        self.state_path = _load_env().state_path if state_path is None else state_path
+
+        # Initialize default tasks. Tasks that ran recently before a restart
+        # resume their cadence; the rest are due immediately.
         self._setup_default_tasks()
+        self._load_state()
+        for task in self.tasks.values():
+            self._reschedule(task)
 
     def _setup_default_tasks(self) -> None:
         """Set up default scraper tasks."""
-        import os
-
+        env = _load_env()
         proxy_url = self.proxy_manager.get_proxy() if self.proxy_manager.is_enabled() else ""
 
+        def delay(default_ms: int) -> int:
+            return default_ms if env.delay_ms is None else env.delay_ms
+
         # eBay UK (API-driven, primary source)
         self.tasks["ebay"] = ScraperTask(
             name="ebay",
-            enabled=os.getenv("SCRAPER_EBAY_ENABLED", "true").lower() == "true",
+            enabled=env.ebay_enabled,
             interval_seconds=60,
-            factory=create_ebay_scraper,
-            kwargs={
-                "app_id": os.getenv("EBAY_APP_ID", ""),
-                "cert_id": os.getenv("EBAY_CERT_ID", ""),
-                "oauth_token": os.getenv("EBAY_OAUTH_TOKEN", ""),
-                "request_delay_ms": int(os.getenv("SCRAPER_REQUEST_DELAY_MS", "1000")),
-            },
+            factory=partial(
+                create_ebay_scraper,
+                app_id=env.ebay_app_id,
+                cert_id=env.ebay_cert_id,
+                oauth_token=env.ebay_oauth_token,
+                request_delay_ms=delay(1000),
+            ),
         )
 
         # Cardmarket (scraping)
         self.tasks["cardmarket"] = ScraperTask(
             name="cardmarket",
-            enabled=os.getenv("SCRAPER_CARDMARKET_ENABLED", "true").lower() == "true",
+            enabled=env.cardmarket_enabled,
             interval_seconds=120,  # Less frequent due to scraping
-            factory=create_cardmarket_scraper,
-            kwargs={
-                "proxy_url": proxy_url,
-                "request_delay_ms": int(os.getenv("SCRAPER_REQUEST_DELAY_MS", "2000")),
-            },
+            factory=partial(
+                create_cardmarket_scraper,
+                proxy_url=proxy_url,
+                request_delay_ms=delay(2000),
+            ),
         )
 
         # Vinted (scraping, bundles)
         self.tasks["vinted"] = ScraperTask(
             name="vinted",
-            enabled=os.getenv("SCRAPER_VINTED_ENABLED", "false").lower() == "true",
+            enabled=env.vinted_enabled,
             interval_seconds=180,  # Less frequent
-            factory=create_vinted_scraper,
-            kwargs={
-                "proxy_url": proxy_url,
-                "request_delay_ms": int(os.getenv("SCRAPER_REQUEST_DELAY_MS", "3000")),
-            },
+            factory=partial(
+                create_vinted_scraper,
+                proxy_url=proxy_url,
+                request_delay_ms=delay(3000),
+            ),
         )
 
         # Magic Madhouse (retail)
         self.tasks["magicmadhouse"] = ScraperTask(
             name="magicmadhouse",
-            enabled=os.getenv("SCRAPER_MAGICMADHOUSE_ENABLED", "true").lower() == "true",
+            enabled=env.magicmadhouse_enabled,
             interval_seconds=300,  # Retail changes less frequently
-            factory=create_magicmadhouse_scraper,
-            kwargs={
-                "proxy_url": proxy_url,
-                "request_delay_ms": int(os.getenv("SCRAPER_REQUEST_DELAY_MS", "2000")),
-            },
+            factory=partial(
+                create_magicmadhouse_scraper,
+                proxy_url=proxy_url,
+                request_delay_ms=delay(2000),
+                http_cache_path=env.http_cache_path,
+            ),
         )
 
         # Chaos Cards (retail)
         self.tasks["chaoscards"] = ScraperTask(
             name="chaoscards",
-            enabled=os.getenv("SCRAPER_CHAOSCARDS_ENABLED", "true").lower() == "true",
+            enabled=env.chaoscards_enabled,
             interval_seconds=300,  # Retail changes less frequently
-            factory=create_chaoscards_scraper,
-            kwargs={
-                "proxy_url": proxy_url,
-                "request_delay_ms": int(os.getenv("SCRAPER_REQUEST_DELAY_MS", "2000")),
-            },
+            factory=partial(
+                create_chaoscards_scraper,
+                proxy_url=proxy_url,
+                request_delay_ms=delay(2000),
+                http_cache_path=env.http_cache_path,
+            ),
         )
 
+    def _load_state(self) -> None:
+        """Restore task last-run times saved by a previous process."""
+        if not self.state_path:
+            return
+
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scheduler state: {e}")
+            return
+
+        for name, last_run_epoch in state.items():
+            task = self.tasks.get(name)
+            if task and isinstance(last_run_epoch, (int, float)):
+                task.last_run = datetime.fromtimestamp(last_run_epoch, UTC)
+
+    def _save_state(self) -> None:
+        """Atomically write task last-run times to the state file."""
+        if not self.state_path:
+            return
+
+        state = {
+            name: task.last_run.timestamp()
+            for name, task in self.tasks.items()
+            if task.last_run is not None
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to save scheduler state: {e}")
+
+    @staticmethod
+    def _effective_interval(task: ScraperTask) -> float:
+        """Task interval doubled per consecutive failure, capped."""
+        if task.consecutive_failures == 0:
+            return task.interval_seconds
+        backoff = task.interval_seconds * 2 ** min(task.consecutive_failures, 5)
+        return min(backoff, max(MAX_BACKOFF_SECONDS, task.interval_seconds))
+
+    @staticmethod
+    def _update_backoff(task: ScraperTask, result: ScraperResult) -> None:
+        """Track consecutive failures; empty runs back off one step at most."""
+        if not result.success:
+            task.consecutive_failures += 1
+        elif not result.listings:
+            task.consecutive_failures = 1
+        else:
+            task.consecutive_failures = 0
+
+    def _schedule(self, name: str, due_at: float) -> None:
+        """Push a task's next fire time, superseding any earlier entry."""
+        generation = self._generations.get(name, 0) + 1
+        self._generations[name] = generation
+        heapq.heappush(self._heap, (due_at, generation, name))
+        self._wake_event.set()
+
+    def _reschedule(self, task: ScraperTask) -> None:
+        """Schedule a task one (jittered) interval after its last run, or now."""
+        now = time.monotonic()
+        interval = _jittered(self._effective_interval(task))
+        if task.last_run_monotonic is not None:
+            self._schedule(task.name, task.last_run_monotonic + interval)
+        elif task.last_run is not None:
+            # Restored from disk: translate the wall-clock gap
+            since = time.time() - task.last_run.timestamp()
+            self._schedule(task.name, now - since + interval)
+        else:
+            self._schedule(task.name, now)
+
+    def _is_current(self, generation: int, name: str) -> bool:
+        """Check a heap entry is the latest for an enabled task."""
+        task = self.tasks.get(name)
+        return bool(task and task.enabled and self._generations.get(name) == generation)
+
+    def _next_due(self) -> Optional[float]:
+        """Return the earliest pending fire time, discarding stale entries."""
+        while self._heap:
+            due_at, generation, name = self._heap[0]
+            if self._is_current(generation, name):
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
     def enable_task(self, name: str) -> None:
         """Enable a scraper task."""
         if name in self.tasks:
             self.tasks[name].enabled = True
+            if name not in self._running_tasks:
+                self._reschedule(self.tasks[name])
 
     def disable_task(self, name: str) -> None:
         """Disable a scraper task."""
@@ -170,36 +339,58 @@ class ScraperScheduler:
         """Set the interval for a scraper task."""
         if name in self.tasks:
             self.tasks[name].interval_seconds = max(30, interval_seconds)
+            # A running task picks up the new interval when it finishes
+            if name not in self._running_tasks:
+                self._reschedule(self.tasks[name])
 
     async def run_task(self, task: ScraperTask) -> ScraperResult:
         """Run a single scraper task."""
         self.logger = logging.getLogger(f"scheduler.{task.name}")
         self.logger.info(f"Running scraper: {task.name}")
+        self._running_tasks.add(task.name)
 
         try:
             # Check if scraper can be created
             if not task.factory:
                 raise ValueError(f"No factory for task: {task.name}")
 
-            # Create scraper instance
-            scraper = task.factory(**task.kwargs)
+            # Create the scraper once and reuse it (keeps HTTP connections alive)
+            if task.instance is None:
+                task.instance = task.factory()
+            scraper = task.instance
 
             # Check if configured
             if not scraper.is_configured():
                 self.logger.warning(f"Scraper not configured: {task.name}")
-                return ScraperResult(
+                result = ScraperResult(
                     platform=task.name,
                     success=False,
                     listings=[],
                     error="Not configured",
                 )
+                self._update_backoff(task, result)
+                return result
 
-            # Run the scraper
-            result = await scraper.run()
+            # Run the scraper, bounded so a stalled upstream can't hold
+            # the task past its next slot
+            timeout = task.interval_seconds * 0.9
+            try:
+                result = await asyncio.wait_for(scraper.run(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # The scraper was interrupted mid-request; don't reuse it
+                await self._close_instance(task)
+                result = ScraperResult(
+                    platform=task.name,
+                    success=False,
+                    listings=[],
+                    error="timeout",
+                )
 
             # Update task state
             task.last_run = datetime.now(UTC)
+            task.last_run_monotonic = time.monotonic()
             task.last_result = result
+            self._update_backoff(task, result)
 
             if result.success:
                 self.logger.info(
@@ -211,6 +402,12 @@ class ScraperScheduler:
 
             return result
 
+        except asyncio.CancelledError:
+            # Drop the scraper mid-request so the next run starts clean
+            self.logger.info(f"Scraper {task.name} cancelled")
+            await self._close_instance(task)
+            raise
+
         except Exception as e:
             self.logger.error(f"Scraper {task.name} exception: {e}", exc_info=True)
             self.stats.total_errors += 1
@@ -218,62 +415,84 @@ class ScraperScheduler:
             if self.on_error:
                 await self._call_handler(self.on_error, task.name, e)
 
-            return ScraperResult(
+            result = ScraperResult(
                 platform=task.name,
                 success=False,
                 listings=[],
                 error=str(e),
             )
+            self._update_backoff(task, result)
+            return result
+
+        finally:
+            self._running_tasks.discard(task.name)
+            # Next run is one (jittered, backed-off) interval after this one
+            # finished
+            interval = self._effective_interval(task)
+            if task.consecutive_failures:
+                self.logger.info(
+                    f"Backing off {task.name}: next run in {interval:.0f}s "
+                    f"({task.consecutive_failures} unproductive runs)"
+                )
+            self._schedule(task.name, time.monotonic() + _jittered(interval))
+            self._save_state()
+
+    async def _gated(self, task: ScraperTask) -> ScraperResult:
+        """Run a task once a concurrency slot is free."""
+        async with self._run_sem:
+            return await self.run_task(task)
 
     async def run_all_due(self) -> list[ScraperResult]:
         """Run all scrapers that are due."""
-        now = datetime.now(UTC)
+        now = datetime.now(UTC)  # Stats only
+        now_m = time.monotonic()
         due_tasks = []
 
-        for task in self.tasks.values():
-            if not task.enabled:
-                continue
-
-            # Check if due
-            if task.last_run is None:
-                due_tasks.append(task)
-            else:
-                elapsed = (now - task.last_run).total_seconds()
-                if elapsed >= task.interval_seconds:
-                    due_tasks.append(task)
+        # Pop every entry whose fire time has passed
+        while self._heap and self._heap[0][0] <= now_m:
+            _, generation, name = heapq.heappop(self._heap)
+            if self._is_current(generation, name):
+                due_tasks.append(self.tasks[name])
 
         if not due_tasks:
             return []
 
-        # Run due tasks concurrently
-        results = await asyncio.gather(
-            *[self.run_task(task) for task in due_tasks],
-            return_exceptions=True,
-        )
-
-        # Process results
+        # Run due tasks concurrently (bounded by SCRAPER_MAX_CONCURRENCY),
+        # handing each scraper's listings downstream as soon as it finishes.
+        # The task group ties the runs to this call, so cancelling it (or
+        # stop()) cancels every scraper still in flight.
         valid_results = []
-        all_listings = []
+        listing_count = 0
 
-        for result in results:
-            if isinstance(result, Exception):
-                self.stats.total_errors += 1
-                continue
+        async with asyncio.TaskGroup() as tg:
+            pending = {tg.create_task(self._gated(task)) for task in due_tasks}
+            self._in_flight = list(pending)
 
-            if isinstance(result, ScraperResult):
-                valid_results.append(result)
-                if result.success:
-                    all_listings.extend(result.listings)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for handle in done:
+                    if handle.cancelled():
+                        continue
+                    if handle.exception() is not None:
+                        self.stats.total_errors += 1
+                        continue
+
+                    result = handle.result()
+                    valid_results.append(result)
+                    if result.success and result.listings:
+                        listing_count += len(result.listings)
+                        if self.on_listings_found:
+                            await self._call_handler(self.on_listings_found, result.listings)
+
+        self._in_flight = []
 
         # Update stats
         self.stats.total_runs += 1
-        self.stats.total_listings += len(all_listings)
+        self.stats.total_listings += listing_count
         self.stats.last_run_time = now
 
-        # Call handler if we have listings
-        if all_listings and self.on_listings_found:
-            await self._call_handler(self.on_listings_found, all_listings)
-
         return valid_results
 
     async def run_once(self) -> list[ScraperResult]:
@@ -283,7 +502,7 @@ class ScraperScheduler:
         tasks = [task for task in self.tasks.values() if task.enabled]
 
         results = await asyncio.gather(
-            *[self.run_task(task) for task in tasks],
+            *[self._gated(task) for task in tasks],
             return_exceptions=True,
         )
 
@@ -303,41 +522,73 @@ class ScraperScheduler:
 
         return valid_results
 
-    async def start(self, check_interval: int = 10) -> None:
+    async def start(self, check_interval: Optional[float] = None) -> None:
         """
         Start the scheduler loop.
 
+        Sleeps until the next task is due (or the schedule changes),
+        rather than polling on a fixed interval.
+
         Args:
-            check_interval: How often to check for due tasks (seconds)
+            check_interval: Optional upper bound on each sleep (seconds),
+                so the schedule is re-checked at least this often
         """
         self.running = True
-        self._stop_event.clear()
         self.stats.start_time = datetime.now(UTC)
 
         logger.info("Scheduler starting...")
 
         while self.running:
+            self._wake_event.clear()
+            next_due = self._next_due()
+            timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+            if check_interval is not None:
+                timeout = check_interval if timeout is None else min(timeout, check_interval)
+
+            # Wait for the next fire time, a schedule change, or stop()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+                continue  # Woken early: re-check running flag and heap
+            except asyncio.TimeoutError:
+                pass
+
             try:
                 await self.run_all_due()
             except Exception as e:
                 logger.error(f"Scheduler error: {e}", exc_info=True)
 
-            # Wait for next check or stop signal
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=check_interval,
-                )
-                break  # Stop event was set
-            except asyncio.TimeoutError:
-                pass  # Continue loop
-
+        await self.close()
         logger.info("Scheduler stopped")
 
     def stop(self) -> None:
-        """Stop the scheduler loop."""
+        """
+        Stop the scheduler loop.
+
+        Scrapers still running are cancelled; cached scrapers are closed
+        as the loop exits.
+        """
         self.running = False
-        self._stop_event.set()
+        for handle in self._in_flight:
+            handle.cancel()
+        self._wake_event.set()
+
+    async def _close_instance(self, task: ScraperTask) -> None:
+        """Close and forget a task's cached scraper."""
+        scraper, task.instance = task.instance, None
+        if scraper is None or not hasattr(scraper, "close"):
+            return
+        try:
+            await scraper.close()
+        except Exception as e:
+            logger.warning(f"Failed to close scraper {task.name}: {e}")
+
+    async def close(self) -> None:
+        """Close cached scraper instances and proxy health-check clients."""
+        for task in self.tasks.values():
+            await self._close_instance(task)
+
+        if self.proxy_manager:
+            await self.proxy_manager.close()
 
     async def _call_handler(self, handler: Callable, *args) -> None:
         """Call a handler, supporting both sync and async."""
@@ -366,6 +617,7 @@ class ScraperScheduler:
                     "last_run": task.last_run.isoformat() if task.last_run else None,
                     "last_success": task.last_result.success if task.last_result else None,
                     "last_count": len(task.last_result.listings) if task.last_result else 0,
+                    "consecutive_failures": task.consecutive_failures,
                 }
                 for name, task in self.tasks.items()
             },
@@ -8,13 +8,21 @@ Usage:
     python -m scrapers.sync_cards --sets          # Sync all sets
     python -m scrapers.sync_cards --set base1     # Sync specific set
     python -m scrapers.sync_cards --popular       # Sync popular/valuable sets
+    python -m scrapers.sync_cards --popular --output cards.ndjson
 """
 import asyncio
 import argparse
 import logging
+import os
+import re
+from dataclasses import dataclass, fields
 from datetime import datetime, UTC
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
+import orjson
+
+from .json_utils import loads, new_parser
 from .pokemon_tcg_api import PokemonTCGClient, CardData, SetData, create_pokemon_tcg_client
 
 # Configure logging
@@ -25,7 +33,7 @@ logging.basicConfig(
 logger = logging.getLogger("sync_cards")
 
 # Sets known to contain valuable cards (for initial sync)
-POPULAR_SETS = [
+POPULAR_SETS: tuple[str, ...] = (
     # Base Set Era
     "base1",      # Base Set
     "base2",      # Jungle
@@ -57,11 +65,257 @@ POPULAR_SETS = [
     "sv4",        # Paradox Rift
     "sv5",        # Temporal Forces
     "sv6",        # Twilight Masquerade
-]
+)
 
 # USD to GBP conversion (approximate, should use live rate in production)
 USD_TO_GBP = 0.79
 
+# Era rules by series name, checked in order (first match wins)
+_ERA_RULES = [
+    # WotC Era (1999-2003)
+    (re.compile(r"base|gym|neo|legendary|e-card", re.I), "wotc_vintage"),
+    # EX Era (2003-2007)
+    (re.compile(r"ex", re.I), "ex_era"),
+    # Diamond & Pearl Era
+    (re.compile(r"diamond|platinum", re.I), "dp_era"),
+    # HeartGold/SoulSilver & Black/White Era
+    (re.compile(r"heartgold|black", re.I), "bw_era"),
+    # XY Era
+    (re.compile(r"xy", re.I), "xy_era"),
+    # Sun & Moon Era
+    (re.compile(r"^(?=.*sun)(?=.*moon)", re.I | re.S), "sm_era"),
+    # Sword & Shield Era
+    (re.compile(r"^(?=.*sword)(?=.*shield)", re.I | re.S), "swsh_era"),
+    # Scarlet & Violet Era (current)
+    (re.compile(r"^(?=.*scarlet)(?=.*violet)", re.I | re.S), "modern_chase"),
+]
+
+
+@lru_cache(maxsize=256)
+def _classify_era(series: Optional[str], release_date: Optional[str]) -> str:
+    """Classify a set into an era based on series/date."""
+    if series:
+        for pattern, era in _ERA_RULES:
+            if pattern.search(series):
+                return era
+
+    # Default based on date
+    if release_date:
+        year = int(release_date.split("/")[0]) if "/" in release_date else 2020
+        if year >= 2023:
+            return "modern_chase"
+        elif year >= 2019:
+            return "swsh_era"
+
+    return "other"
+
+
+# Era for each known set id, so the per-card path is a single dict lookup
+_ERA_BY_SETID_PREFIX = (
+    ("base", "wotc_vintage"),
+    ("neo", "wotc_vintage"),
+    ("swsh", "swsh_era"),
+    ("sv", "modern_chase"),
+)
+ERA_BY_SETID: dict[str, str] = {
+    set_id: next(era for prefix, era in _ERA_BY_SETID_PREFIX if set_id.startswith(prefix))
+    for set_id in POPULAR_SETS
+}
+
+
+def _classify_era_fast(
+    set_id: str, series: Optional[str] = None, release_date: Optional[str] = None
+) -> str:
+    """Classify a set by id, falling back to series/date rules for unknown ids."""
+    era = ERA_BY_SETID.get(set_id)
+    if era is None:
+        era = _classify_era(series, release_date)
+    return era
+
+
+@dataclass(slots=True)
+class ProcessedSet:
+    """Set row ready for database storage."""
+    id: str
+    name: str
+    series: str
+    total_cards: int
+    release_date: Optional[str]
+    logo_url: Optional[str]
+    symbol_url: Optional[str]
+    era: str
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "series": self.series,
+            "total_cards": self.total_cards,
+            "release_date": self.release_date,
+            "logo_url": self.logo_url,
+            "symbol_url": self.symbol_url,
+            "era": self.era,
+        }
+
+
+@dataclass(slots=True)
+class ProcessedCard:
+    """Card row ready for database storage (prices in GBP)."""
+    id: str
+    name: str
+    set_id: str
+    set_name: str
+    number: str
+    rarity: Optional[str]
+    image_small: Optional[str]
+    image_large: Optional[str]
+    market_value_nm: Optional[float]
+    cardmarket_low: Optional[float]
+    cardmarket_trend: Optional[float]
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "set_id": self.set_id,
+            "set_name": self.set_name,
+            "number": self.number,
+            "rarity": self.rarity,
+            "image_small": self.image_small,
+            "image_large": self.image_large,
+            "market_value_nm": self.market_value_nm,
+            "cardmarket_low": self.cardmarket_low,
+            "cardmarket_trend": self.cardmarket_trend,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize as one NDJSON line (no intermediate dict)."""
+        return orjson.dumps(self, option=orjson.OPT_APPEND_NEWLINE)
+
+
+# Column order for bulk inserts (executemany / COPY)
+PROCESSED_CARD_COLUMNS = tuple(f.name for f in fields(ProcessedCard))
+
+
+def cards_to_columns(cards: list[ProcessedCard]) -> dict[str, list]:
+    """
+    Transpose processed cards into parallel column lists.
+
+    Suitable for columnar bulk inserts where each column is sent
+    as one buffer rather than one dict per row.
+    """
+    return {
+        column: [getattr(card, column) for card in cards]
+        for column in PROCESSED_CARD_COLUMNS
+    }
+
+
+def _process_set_data(set_data: SetData) -> ProcessedSet:
+    """Process set data for database storage."""
+    # Determine era based on series
+    era = _classify_era_fast(set_data.id, set_data.series, set_data.release_date)
+
+    return ProcessedSet(
+        id=set_data.id,
+        name=set_data.name,
+        series=set_data.series,
+        total_cards=set_data.total_cards,
+        release_date=set_data.release_date,
+        logo_url=set_data.logo_url,
+        symbol_url=set_data.symbol_url,
+        era=era,
+    )
+
+
+def _process_card(card: CardData) -> ProcessedCard:
+    """Process card data for database storage."""
+    # Convert USD prices to GBP (approximate)
+    cardmarket_trend = round(card.cardmarket_trend, 2) if card.cardmarket_trend else None
+    cardmarket_low = round(card.cardmarket_low, 2) if card.cardmarket_low else None
+
+    if card.tcgplayer_market:
+        market_value_nm = round(card.tcgplayer_market * USD_TO_GBP, 2)
+    else:
+        market_value_nm = cardmarket_trend  # Already in EUR/GBP-ish
+
+    return ProcessedCard(
+        id=card.id,
+        name=card.name,
+        set_id=card.set_id,
+        set_name=card.set_name,
+        number=card.number,
+        rarity=card.rarity,
+        image_small=card.image_small,
+        image_large=card.image_large,
+        market_value_nm=market_value_nm,
+        cardmarket_low=cardmarket_low,
+        cardmarket_trend=cardmarket_trend,
+    )
+
+
+# The bulk helpers are plain functions so they can run in a worker
+# thread; they report an error count instead of touching service stats.
+
+def _process_cards_bulk(cards: list[CardData]) -> tuple[list[ProcessedCard], int]:
+    """Process a list of cards, skipping (and counting) failures."""
+    processed = []
+    errors = 0
+
+    for card in cards:
+        try:
+            processed.append(_process_card(card))
+        except Exception as e:
+            logger.warning(f"Failed to process card {card.id}: {e}")
+            errors += 1
+
+    return processed, errors
+
+
+def _process_sets_bulk(sets: list[SetData]) -> tuple[list[ProcessedSet], int]:
+    """Process a list of sets, skipping (and counting) failures."""
+    processed = []
+    errors = 0
+
+    for set_data in sets:
+        try:
+            processed.append(_process_set_data(set_data))
+        except Exception as e:
+            logger.error(f"Failed to sync set {set_data.id}: {e}")
+            errors += 1
+
+    return processed, errors
+
+
+async def write_ndjson(queue: asyncio.Queue, path: str) -> int:
+    """
+    Single writer draining preserialized lines from a queue to a file.
+
+    Stops when it receives ``None``.
+
+    Returns:
+        Number of lines written
+    """
+    written = 0
+    with open(path, "wb") as f:
+        while (line := await queue.get()) is not None:
+            f.write(line)
+            written += 1
+    return written
+
+
+def stream_cards(path: str) -> Iterator[ProcessedCard]:
+    """
+    Read processed cards back from an NDJSON file written by write_ndjson().
+
+    Lines are decoded one at a time through a single reused parser, so
+    large dumps are never held in memory at once.
+    """
+    parser = new_parser()
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield ProcessedCard(**loads(line, parser))
+
 
 class CardSyncService:
     """
@@ -75,41 +329,71 @@ class CardSyncService:
             "cards_synced": 0,
             "errors": 0,
         }
+        # In-flight set syncs, so overlapping callers share one fetch
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Eras of sets seen by sync_all_sets, keyed by set id
+        self._set_eras: dict[str, str] = {}
 
-    async def sync_all_sets(self) -> list[dict]:
+    async def sync_all_sets(self) -> list[ProcessedSet]:
         """
         Sync all Pokemon TCG sets to database.
 
         Returns:
-            List of synced set data dicts
+            List of processed sets
         """
         logger.info("Fetching all sets from Pokemon TCG API...")
         sets = await self.client.get_all_sets()
 
         logger.info(f"Found {len(sets)} sets")
 
-        synced = []
-        for set_data in sets:
-            try:
-                result = await self._process_set(set_data)
-                synced.append(result)
-                self.stats["sets_synced"] += 1
-            except Exception as e:
-                logger.error(f"Failed to sync set {set_data.id}: {e}")
-                self.stats["errors"] += 1
+        # Pure-Python processing, kept off the event loop
+        synced, errors = await asyncio.to_thread(_process_sets_bulk, sets)
 
+        self._set_eras.update((s.id, s.era) for s in synced)
+        self.stats["sets_synced"] += len(synced)
+        self.stats["errors"] += errors
         return synced
 
     async def sync_set(self, set_id: str) -> Optional[dict]:
         """
         Sync a single set and all its cards.
 
+        Concurrent calls for the same set share a single fetch.
+
+        Args:
+            set_id: Pokemon TCG API set ID
+
+        Returns:
+            Dict with the processed set and its processed cards, or None on error
+        """
+        task = self._inflight.get(set_id)
+        if task is None:
+            task = asyncio.create_task(self._sync_set(set_id))
+            self._inflight[set_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(set_id, None))
+
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def stream_set(self, set_id: str, queue: asyncio.Queue) -> Optional[dict]:
+        """
+        Sync a set and push each processed card onto a queue as an NDJSON line.
+
         Args:
             set_id: Pokemon TCG API set ID
+            queue: Queue consumed by a writer such as write_ndjson()
 
         Returns:
-            Dict with set and cards data, or None on error
+            Same as sync_set()
         """
+        result = await self.sync_set(set_id)
+        if result:
+            for card in result["cards"]:
+                await queue.put(card.to_json())
+        return result
+
+    async def _sync_set(self, set_id: str) -> Optional[dict]:
+        """Fetch and process a set and its cards."""
         logger.info(f"Syncing set: {set_id}")
 
         # Get set info
@@ -123,15 +407,7 @@ class CardSyncService:
         logger.info(f"Found {len(cards)} cards in {set_data.name}")
 
         # Process cards
-        processed_cards = []
-        for card in cards:
-            try:
-                processed = self._process_card(card)
-                processed_cards.append(processed)
-                self.stats["cards_synced"] += 1
-            except Exception as e:
-                logger.warning(f"Failed to process card {card.id}: {e}")
-                self.stats["errors"] += 1
+        processed_cards = await self._process_cards_batch(cards)
 
         self.stats["sets_synced"] += 1
 
@@ -140,125 +416,79 @@ class CardSyncService:
             "cards": processed_cards,
         }
 
-    async def sync_popular_sets(self) -> list[dict]:
+    async def sync_popular_sets(self, queue: Optional[asyncio.Queue] = None) -> list[dict]:
         """
         Sync only the most popular/valuable sets.
 
+        Args:
+            queue: Optional queue to stream card NDJSON lines onto as
+                each set finishes (see stream_set)
+
         Returns:
             List of synced set data with cards
         """
         logger.info(f"Syncing {len(POPULAR_SETS)} popular sets...")
 
+        # Start several sets at once. This only bounds how many sets are
+        # open; the client's request slots bound what hits the API.
+        limit = os.getenv("SYNC_CONCURRENCY")
+        sem = asyncio.Semaphore(
+            int(limit) if limit else self.client.max_concurrent_requests
+        )
+
+        async def sync_one(set_id: str) -> Optional[dict]:
+            async with sem:
+                if queue is not None:
+                    return await self.stream_set(set_id, queue)
+                return await self.sync_set(set_id)
+
+        outcomes = await asyncio.gather(
+            *[sync_one(set_id) for set_id in POPULAR_SETS],
+            return_exceptions=True,
+        )
+
         results = []
-        for set_id in POPULAR_SETS:
-            try:
-                result = await self.sync_set(set_id)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to sync {set_id}: {e}")
+        for set_id, outcome in zip(POPULAR_SETS, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to sync {set_id}: {outcome}")
                 self.stats["errors"] += 1
+            elif outcome:
+                results.append(outcome)
 
         return results
 
-    def _process_set_data(self, set_data: SetData) -> dict:
+    def _process_set_data(self, set_data: SetData) -> ProcessedSet:
         """Process set data for database storage."""
-        # Determine era based on series
-        era = self._classify_era(set_data.series, set_data.release_date)
+        return _process_set_data(set_data)
 
-        return {
-            "id": set_data.id,
-            "name": set_data.name,
-            "series": set_data.series,
-            "total_cards": set_data.total_cards,
-            "release_date": set_data.release_date,
-            "logo_url": set_data.logo_url,
-            "symbol_url": set_data.symbol_url,
-            "era": era,
-        }
+    async def _process_cards_batch(self, cards: list[CardData]) -> list[ProcessedCard]:
+        """Process a whole set's cards off the event loop, updating stats once."""
+        processed_cards, errors = await asyncio.to_thread(_process_cards_bulk, cards)
 
-    async def _process_set(self, set_data: SetData) -> dict:
-        """Process set without fetching cards (for bulk set sync)."""
-        return self._process_set_data(set_data)
+        self.stats["cards_synced"] += len(processed_cards)
+        self.stats["errors"] += errors
+        return processed_cards
 
-    def _process_card(self, card: CardData) -> dict:
+    def _process_card(self, card: CardData) -> ProcessedCard:
         """Process card data for database storage."""
-        # Convert USD prices to GBP (approximate)
-        market_value_nm = None
-        cardmarket_low = None
-        cardmarket_trend = None
-
-        if card.tcgplayer_market:
-            market_value_nm = round(card.tcgplayer_market * USD_TO_GBP, 2)
-        elif card.cardmarket_trend:
-            market_value_nm = round(card.cardmarket_trend, 2)  # Already in EUR/GBP-ish
-
-        if card.cardmarket_low:
-            cardmarket_low = round(card.cardmarket_low, 2)
-
-        if card.cardmarket_trend:
-            cardmarket_trend = round(card.cardmarket_trend, 2)
-
-        return {
-            "id": card.id,
-            "name": card.name,
-            "set_id": card.set_id,
-            "set_name": card.set_name,
-            "number": card.number,
-            "rarity": card.rarity,
-            "image_small": card.image_small,
-            "image_large": card.image_large,
-            "market_value_nm": market_value_nm,
-            "cardmarket_low": cardmarket_low,
-            "cardmarket_trend": cardmarket_trend,
-        }
+        return _process_card(card)
 
     def _classify_era(self, series: str, release_date: Optional[str]) -> str:
         """Classify a set into an era based on series/date."""
-        series_lower = series.lower() if series else ""
-
-        # WotC Era (1999-2003)
-        wotc_series = ["base", "gym", "neo", "legendary", "e-card"]
-        if any(s in series_lower for s in wotc_series):
-            return "wotc_vintage"
-
-        # EX Era (2003-2007)
-        if "ex" in series_lower or series_lower.startswith("ex"):
-            return "ex_era"
-
-        # Diamond & Pearl Era
-        if "diamond" in series_lower or "platinum" in series_lower:
-            return "dp_era"
-
-        # HeartGold/SoulSilver & Black/White Era
-        if "heartgold" in series_lower or "black" in series_lower:
-            return "bw_era"
+        return _classify_era(series, release_date)
 
-        # XY Era
-        if "xy" in series_lower:
-            return "xy_era"
-
-        # Sun & Moon Era
-        if "sun" in series_lower and "moon" in series_lower:
-            return "sm_era"
-
-        # Sword & Shield Era
-        if "sword" in series_lower and "shield" in series_lower:
-            return "swsh_era"
-
-        # Scarlet & Violet Era (current)
-        if "scarlet" in series_lower and "violet" in series_lower:
-            return "modern_chase"
-
-        # Default based on date
-        if release_date:
-            year = int(release_date.split("/")[0]) if "/" in release_date else 2020
-            if year >= 2023:
-                return "modern_chase"
-            elif year >= 2019:
-                return "swsh_era"
+    def classify_all(self, cards: list[CardData]) -> list[str]:
+        """
+        Return the era of each card's set, in order.
 
-        return "other"
+        Cards carry only their set's name, not its series, so sets that
+        are neither synced nor in ERA_BY_SETID classify as "other".
+        """
+        eras = self._set_eras
+        return [
+            eras.get(card.set_id) or ERA_BY_SETID.get(card.set_id, "other")
+            for card in cards
+        ]
 
     def get_stats(self) -> dict:
         """Get sync statistics."""
@@ -276,24 +506,34 @@ async def main():
     parser.add_argument("--set", type=str, help="Sync specific set by ID")
     parser.add_argument("--popular", action="store_true", help="Sync popular/valuable sets")
     parser.add_argument("--api-key", type=str, help="Pokemon TCG API key")
+    parser.add_argument("--output", type=str, help="Write synced cards to an NDJSON file")
 
     args = parser.parse_args()
 
     client = create_pokemon_tcg_client(api_key=args.api_key or "")
     service = CardSyncService(client)
 
+    queue: Optional[asyncio.Queue] = None
+    writer: Optional[asyncio.Task] = None
+    if args.output:
+        queue = asyncio.Queue(maxsize=1000)
+        writer = asyncio.create_task(write_ndjson(queue, args.output))
+
     try:
         if args.sets:
             results = await service.sync_all_sets()
             logger.info(f"Synced {len(results)} sets")
 
         elif args.set:
-            result = await service.sync_set(args.set)
+            if queue is not None:
+                result = await service.stream_set(args.set, queue)
+            else:
+                result = await service.sync_set(args.set)
             if result:
-                logger.info(f"Synced {result['set']['name']} with {len(result['cards'])} cards")
+                logger.info(f"Synced {result['set'].name} with {len(result['cards'])} cards")
 
         elif args.popular:
-            results = await service.sync_popular_sets()
+            results = await service.sync_popular_sets(queue)
             total_cards = sum(len(r.get("cards", [])) for r in results)
             logger.info(f"Synced {len(results)} sets with {total_cards} total cards")
 
@@ -305,6 +545,10 @@ async def main():
         logger.info(f"Stats: {stats}")
 
     finally:
+        if writer is not None:
+            await queue.put(None)
+            written = await writer
+            logger.info(f"Wrote {written} cards to {args.output}")
         await service.close()
 
 
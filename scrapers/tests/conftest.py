@@ -0,0 +1,20 @@
+"""
+Shared fixtures for scraper tests.
+
+Scrapers here are only used for parsing and URL building, which don't
+change their state, so one instance is shared per test module.
+"""
+import pytest
+
+from scrapers.magic_madhouse import MagicMadhouseScraper
+from scrapers.chaos_cards import ChaosCardsScraper
+
+
+@pytest.fixture(scope="module")
+def magicmadhouse_scraper():
+    return MagicMadhouseScraper(headless=True, request_delay_ms=0)
+
+
+@pytest.fixture(scope="module")
+def chaoscards_scraper():
+    return ChaosCardsScraper(headless=True, request_delay_ms=0)
@@ -2,9 +2,10 @@
 Tests for eBay UK Browse API scraper.
 """
 import pytest
+from types import MappingProxyType
 from datetime import datetime, UTC
 from scrapers.ebay_uk import EbayUKScraper
-from scrapers.base import RawListing
+from scrapers.base import RawListing, RawListingBatch
 
 
 @pytest.fixture
@@ -17,10 +18,10 @@ def scraper():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_item_summary():
     """Sample eBay Browse API item summary response."""
-    return {
+    return MappingProxyType({
         "itemId": "v1|123456789|0",
         "title": "Pokemon Charizard VMAX 020/189 Darkness Ablaze Near Mint",
         "price": {
@@ -50,7 +51,7 @@ def sample_item_summary():
             "country": "GB"
         },
         "buyingOptions": ["FIXED_PRICE"]
-    }
+    })
 
 
 class TestEbayUKScraper:
@@ -89,6 +90,30 @@ class TestParseListingSuccess:
         assert listing.currency == "GBP"
         assert listing.is_buy_now is True
 
+    def test_parse_raw_response_bytes(self, scraper, sample_item_summary):
+        """Parses listings straight from a raw Browse API response body."""
+        import json
+
+        body = json.dumps({"total": 1, "itemSummaries": [dict(sample_item_summary)]}).encode()
+        items = scraper._parse_response(body)
+        listing = scraper.parse_listing(items[0])
+
+        assert listing.external_id == "v1|123456789|0"
+        assert listing.listing_price == 45.99
+        assert listing.shipping_cost == 1.50
+        assert scraper._parse_response(b'{"total": 0}') == []
+
+    def test_currency_is_interned(self, scraper, sample_item_summary):
+        """Repeated low-cardinality strings share one interned object."""
+        import json
+        import sys
+
+        body = json.dumps({"itemSummaries": [dict(sample_item_summary)]}).encode()
+        listing = scraper.parse_listing(scraper._parse_response(body)[0])
+
+        assert listing.currency is sys.intern("GBP")
+        assert listing.condition is sys.intern("Used")
+
     def test_parse_shipping_cost(self, scraper, sample_item_summary):
         """Extracts shipping cost correctly."""
         listing = scraper.parse_listing(sample_item_summary)
@@ -210,6 +235,16 @@ class TestRawListingDataclass:
         assert d["listing_price"] == 45.99
         assert "found_at" in d
 
+    def test_to_json_bytes(self, scraper, sample_item_summary):
+        """RawListing serializes to JSON bytes matching to_dict()."""
+        import json
+
+        listing = scraper.parse_listing(sample_item_summary)
+        data = listing.to_json()
+
+        assert isinstance(data, bytes)
+        assert json.loads(data) == listing.to_dict()
+
     def test_found_at_timestamp(self, scraper, sample_item_summary):
         """Found timestamp is set automatically."""
         listing = scraper.parse_listing(sample_item_summary)
@@ -224,6 +259,77 @@ class TestRawListingDataclass:
         assert listing.is_buy_now is True
 
 
+class TestRawListingBatch:
+    """Test columnar listing batches."""
+
+    def test_parse_batch_columns(self, scraper, sample_item_summary):
+        """A parsed page is stored column by column."""
+        batch = scraper.parse_batch([sample_item_summary, {"title": "no id"}])
+
+        assert len(batch) == 1
+        assert batch.listing_price[0] == 45.99
+        assert batch.external_id == ["v1|123456789|0"]
+        assert batch.columns()["shipping_cost"] == [1.50]
+
+    def test_parse_batch_skips_row_objects(self, scraper, sample_item_summary, monkeypatch):
+        """Batch parsing fills columns without building a RawListing per item."""
+        expected = scraper.parse_listing(sample_item_summary)
+
+        def no_rows(*args, **kwargs):
+            raise AssertionError("RawListing built during parse_batch")
+
+        monkeypatch.setattr("scrapers.ebay_uk.RawListing", no_rows)
+        batch = scraper.parse_batch([sample_item_summary])
+
+        expected.found_at = batch.found_at[0]
+        assert batch[0] == expected
+
+    def test_parse_page_batch(self, scraper, sample_item_summary):
+        """A raw response page parses straight into a batch."""
+        import json
+
+        body = json.dumps({"itemSummaries": [dict(sample_item_summary)]}).encode()
+        batch = scraper.parse_page(body)
+
+        assert batch.listing_price[0] == 45.99
+        assert batch.condition == ["Used"]
+
+    def test_parse_page_shares_found_at(self, scraper, sample_item_summary):
+        """All listings from one page share the same found_at instance."""
+        import json
+
+        second = {**sample_item_summary, "itemId": "v1|987654321|0"}
+        body = json.dumps({"itemSummaries": [dict(sample_item_summary), second]}).encode()
+        batch = scraper.parse_page(body)
+
+        assert len(batch) == 2
+        assert batch.found_at[0] is batch.found_at[1]
+
+    def test_append_row_binds_by_name(self):
+        """Rows are appended by field name; missing or unknown fields fail."""
+        listing = RawListing("a", "ebay", "https://x/a", "A", 10.0)
+        values = {column: getattr(listing, column) for column in RawListingBatch.COLUMNS}
+        batch = RawListingBatch()
+
+        batch.append_row(**dict(reversed(values.items())))
+        assert batch[0] == listing
+
+        with pytest.raises(TypeError):
+            batch.append_row(**{**values, "extra": 1})
+        values.pop("raw_data")
+        with pytest.raises(TypeError):
+            batch.append_row(**values)
+        assert len(batch) == 1
+
+    def test_rows_materialize_lazily(self, scraper, sample_item_summary):
+        """Indexing a batch rebuilds the original RawListing."""
+        listing = scraper.parse_listing(sample_item_summary)
+        batch = RawListingBatch.from_listings([listing])
+
+        assert batch[0] == listing
+        assert list(batch) == [listing]
+
+
 class TestScraperConfiguration:
     """Test scraper configuration options."""
 
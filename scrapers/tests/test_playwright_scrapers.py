@@ -118,6 +118,11 @@ class TestVintedScraper:
         assert scraper._parse_price("£ 20") == 20.0
         assert scraper._parse_price("£5") == 5.0
 
+    def test_price_parsing_eur_nbsp(self, scraper):
+        """Strips non-breaking spaces and handles comma decimals."""
+        assert scraper._parse_price("15,50\xa0€") == 15.5
+        assert scraper._parse_price("\n£ 7.25 ") == 7.25
+
     def test_price_parsing_invalid(self, scraper):
         """Returns None for invalid prices."""
         assert scraper._parse_price("") is None
@@ -161,6 +166,257 @@ class TestVintedScraper:
         listing = scraper.parse_listing({"title": "Test", "url": ""})
         assert listing is None
 
+    def test_raw_data_kept_only_on_request(self, scraper):
+        """Raw scraped dicts are dropped unless keep_raw is set."""
+        raw_data = {
+            "external_id": "123",
+            "url": "https://www.vinted.co.uk/items/123",
+            "price": 10.0,
+        }
+
+        assert scraper.parse_listing(raw_data).raw_data == {}
+
+        keeping = VintedScraper(request_delay_ms=0, keep_raw=True)
+        assert keeping.parse_listing(raw_data).raw_data is raw_data
+
+    def test_build_item_from_grid_data(self, scraper):
+        """Builds raw listing data from one in-page grid item."""
+        item = scraper._build_item({
+            "href": "/items/4242-pokemon-binder",
+            "title": " Pokemon Binder ",
+            "price": "£30.00",
+            "image": "https://example.com/img.jpg",
+            "seller": " ash ",
+        })
+
+        assert item == {
+            "external_id": "4242",
+            "url": "https://www.vinted.co.uk/items/4242-pokemon-binder",
+            "title": "Pokemon Binder",
+            "price": 30.0,
+            "seller_name": "ash",
+            "image_url": "https://example.com/img.jpg",
+        }
+        assert scraper._build_item({"href": "/items/1", "price": None}) is None
+
+    @pytest.mark.parametrize("resource_type,url,blocked", [
+        ("image", "https://images.vinted.net/t/1.jpg", True),
+        ("font", "https://www.vinted.co.uk/font.woff2", True),
+        ("script", "https://www.google-analytics.com/analytics.js", True),
+        ("script", "https://www.vinted.co.uk/app.js", False),
+        ("document", "https://www.vinted.co.uk/catalog", False),
+    ])
+    async def test_route_blocks_unneeded_requests(self, scraper, resource_type, url, blocked):
+        """Images, fonts and analytics are aborted; page scripts load."""
+        from types import SimpleNamespace
+
+        calls = []
+
+        async def abort():
+            calls.append("abort")
+
+        async def continue_():
+            calls.append("continue")
+
+        route = SimpleNamespace(
+            request=SimpleNamespace(resource_type=resource_type, url=url),
+            abort=abort,
+            continue_=continue_,
+        )
+        await scraper._route_request(route)
+
+        assert calls == ["abort" if blocked else "continue"]
+
+    async def test_search_via_api(self, scraper, monkeypatch):
+        """Keyword searches read the catalog JSON API without a browser."""
+        import httpx
+
+        def handler(request):
+            if request.url.path == "/api/v2/catalog/items":
+                assert request.url.params["search_text"] == "pokemon binder"
+                return httpx.Response(200, json={"items": [{
+                    "id": 555,
+                    "title": "Pokemon Binder ",
+                    "url": "https://www.vinted.co.uk/items/555-binder",
+                    "price": {"amount": "40.0", "currency_code": "GBP"},
+                    "photo": {"url": "https://images.vinted.net/555.jpg"},
+                    "user": {"login": "misty"},
+                }]})
+            return httpx.Response(200, headers={"Set-Cookie": "session=1"})
+
+        async def no_browser(term, url, max_scroll):
+            raise AssertionError("browser fallback used")
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_term", no_browser)
+
+        listings = await scraper.fetch_listings(search_terms=["pokemon binder"])
+
+        assert len(listings) == 1
+        assert listings[0].external_id == "vinted_555"
+        assert listings[0].listing_price == 40.0
+        assert listings[0].seller_name == "misty"
+        await scraper.close()
+
+    async def test_api_repeats_not_reparsed(self, scraper, monkeypatch):
+        """Items repeated across API pages are skipped before parsing."""
+        import httpx
+
+        def handler(request):
+            item = {"id": 9, "title": "Lot", "price": "12.0"}
+            return httpx.Response(200, json={"items": [item]})
+
+        parsed = []
+        parse_listing = scraper.parse_listing
+
+        def counting_parse(raw, found_at=None):
+            parsed.append(raw["external_id"])
+            return parse_listing(raw, found_at)
+
+        scraper.API_PAGE_SIZE = 1
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(scraper, "parse_listing", counting_parse)
+
+        listings = await scraper._search_api("lot", {}, max_pages=3)
+
+        assert [listing.external_id for listing in listings] == ["vinted_9"]
+        assert parsed == ["9"]
+        await scraper.close()
+
+    async def test_api_refusal_falls_back_to_browser(self, scraper, monkeypatch):
+        """A refused API request sends that search to the browser."""
+        import httpx
+
+        browser_terms = []
+
+        async def fake_search(term, url, max_scroll):
+            browser_terms.append(term)
+            return []
+
+        scraper._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403))
+        )
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_term", fake_search)
+
+        await scraper.fetch_listings(search_terms=["a"])
+
+        assert browser_terms == ["a"]
+        await scraper.close()
+
+    async def test_api_fallback_is_per_search(self, scraper, monkeypatch):
+        """One search's API failure leaves the other searches on the API."""
+        import httpx
+
+        def handler(request):
+            if request.url.path != "/api/v2/catalog/items":
+                return httpx.Response(200)
+            if request.url.params["search_text"] == "a":
+                return httpx.Response(200, json=["not", "an", "object"])
+            return httpx.Response(200, json={"items": [{"id": 1, "title": "Lot", "price": "5"}]})
+
+        browser_terms = []
+
+        async def fake_search(term, url, max_scroll):
+            browser_terms.append(term)
+            return []
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_term", fake_search)
+
+        listings = await scraper.fetch_listings(search_terms=["a", "b", "c"])
+
+        assert browser_terms == ["a"]
+        assert [listing.external_id for listing in listings] == ["vinted_1"]
+        await scraper.close()
+
+    async def test_api_page_limit_separate_from_scroll(self, scraper, monkeypatch):
+        """max_api_pages bounds the API search; max_scroll only the browser."""
+        seen = {}
+
+        async def fake_api(term, api_params, max_pages):
+            seen["max_pages"] = max_pages
+            return []
+
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_api", fake_api)
+
+        await scraper.fetch_listings(search_terms=["a"], max_scroll=2, max_api_pages=7)
+
+        assert seen == {"max_pages": 7}
+
+    async def test_empty_search_is_not_an_error(self, scraper, monkeypatch):
+        """A grid that never appears means no results, not a failure."""
+        PlaywrightTimeoutError = pytest.importorskip("playwright.async_api").TimeoutError
+
+        class FakePage:
+            closed = False
+
+            async def goto(self, url, wait_until):
+                pass
+
+            async def wait_for_selector(self, selector, timeout):
+                assert timeout == 10000
+                raise PlaywrightTimeoutError("no grid")
+
+            async def close(self):
+                self.closed = True
+
+        page = FakePage()
+
+        async def get_page():
+            return page
+
+        async def no_popups(page):
+            pass
+
+        async def no_screenshot(page, name):
+            raise AssertionError("screenshot taken")
+
+        monkeypatch.setattr(scraper, "_get_page", get_page)
+        monkeypatch.setattr(scraper, "_handle_popups", no_popups)
+        monkeypatch.setattr(scraper, "_take_screenshot", no_screenshot)
+
+        assert await scraper._search_term("nothing", "https://x", max_scroll=3) == []
+        assert page.closed is True
+
+    async def test_popups_handled_once_per_context(self, scraper):
+        """Popup handling is skipped after it succeeds, until close()."""
+        class FakePage:
+            queries = 0
+
+            async def query_selector(self, selector):
+                self.queries += 1
+                return None
+
+            async def query_selector_all(self, selector):
+                self.queries += 1
+                return []
+
+        page = FakePage()
+        await scraper._handle_popups(page)
+        await scraper._handle_popups(page)
+        assert page.queries == 2
+
+        await scraper.close()
+        await scraper._handle_popups(page)
+        assert page.queries == 4
+
+    async def test_extract_forwards_seen_ids(self, scraper):
+        """Seen item ids are passed to the in-page extraction."""
+        class FakePage:
+            async def evaluate(self, script, arg):
+                self.arg = arg
+                return [{"href": "/items/7", "price": "£5"}]
+
+        page = FakePage()
+        listings = await scraper._extract_listings_from_page(page, {"3"})
+
+        assert page.arg["seen"] == ["3"]
+        assert [item["external_id"] for item in listings] == ["7"]
+
     def test_default_shipping(self, scraper):
         """Sets default Vinted shipping cost."""
         raw_data = {
@@ -177,6 +433,82 @@ class TestVintedScraper:
         """Uses UK Vinted URL."""
         assert scraper.BASE_URL == "https://www.vinted.co.uk"
 
+    async def test_keyword_searches_run_concurrently(self, scraper, monkeypatch):
+        """Searches overlap up to SEARCH_CONCURRENCY and results are deduplicated."""
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        async def no_api(term, api_params, max_pages):
+            return None
+
+        async def fake_search(term, url, max_scroll):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [scraper.parse_listing({
+                "external_id": "1",
+                "url": "https://www.vinted.co.uk/items/1",
+                "price": 10.0,
+            })]
+
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_term", fake_search)
+        monkeypatch.setattr(scraper, "_search_api", no_api)
+
+        listings = await scraper.fetch_listings(search_terms=["a", "b", "c", "d", "e"])
+
+        assert peak == scraper.SEARCH_CONCURRENCY
+        assert [listing.external_id for listing in listings] == ["vinted_1"]
+
+    async def test_default_search_urls_prebuilt(self, scraper, monkeypatch):
+        """Default keyword searches use the URLs built at import."""
+        urls = []
+
+        async def no_api(term, api_params, max_pages):
+            return None
+
+        async def fake_search(term, url, max_scroll):
+            urls.append(url)
+            return []
+
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_api", no_api)
+        monkeypatch.setattr(scraper, "_search_term", fake_search)
+
+        await scraper.fetch_listings()
+
+        assert urls == [url for _, url in VintedScraper._DEFAULT_URLS[:5]]
+        assert urls[0] == scraper._build_search_url(scraper.BUNDLE_KEYWORDS[0])
+
+    async def test_browser_kept_warm_between_fetches(self, scraper, monkeypatch):
+        """fetch_listings leaves the browser open; the context manager closes it."""
+        closed = []
+
+        async def no_api(term, api_params, max_pages):
+            return None
+
+        async def fake_search(term, url, max_scroll):
+            return []
+
+        async def fake_close():
+            closed.append(True)
+
+        monkeypatch.setattr(scraper, "is_configured", lambda: True)
+        monkeypatch.setattr(scraper, "_search_term", fake_search)
+        monkeypatch.setattr(scraper, "_search_api", no_api)
+        monkeypatch.setattr(scraper, "close", fake_close)
+
+        async with scraper as s:
+            await s.fetch_listings(search_terms=["a"])
+            await s.fetch_listings(search_terms=["b"])
+            assert closed == []
+
+        assert closed == [True]
+
 
 class TestPlaywrightAvailability:
     """Test Playwright availability checking."""
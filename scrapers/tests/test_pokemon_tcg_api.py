@@ -2,7 +2,17 @@
 Tests for Pokemon TCG API client.
 """
 import pytest
-from scrapers.pokemon_tcg_api import PokemonTCGClient, CardData, SetData
+from types import MappingProxyType
+from scrapers import pokemon_tcg_api
+from scrapers.pokemon_tcg_api import PokemonTCGClient, CardData, SetData, ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_pools():
+    """Keep each test's connection pools to itself."""
+    pokemon_tcg_api._shared_pools.clear()
+    yield
+    pokemon_tcg_api._shared_pools.clear()
 
 
 @pytest.fixture
@@ -11,10 +21,10 @@ def client():
     return PokemonTCGClient(api_key="", request_delay_ms=0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_card_response():
     """Sample card data from API."""
-    return {
+    return MappingProxyType({
         "id": "base1-4",
         "name": "Charizard",
         "number": "4",
@@ -51,13 +61,13 @@ def sample_card_response():
                 "trendPrice": 220.0,
             }
         }
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_set_response():
     """Sample set data from API."""
-    return {
+    return MappingProxyType({
         "id": "base1",
         "name": "Base",
         "series": "Base",
@@ -69,7 +79,7 @@ def sample_set_response():
             "symbol": "https://images.pokemontcg.io/base1/symbol.png",
             "logo": "https://images.pokemontcg.io/base1/logo.png",
         }
-    }
+    })
 
 
 class TestCardDataParsing:
@@ -84,6 +94,18 @@ class TestCardDataParsing:
         assert card.number == "4"
         assert card.rarity == "Rare Holo"
 
+    def test_parse_pages_with_shared_parser(self, client, sample_card_response):
+        """Successive page bodies decode through one client without clobbering."""
+        import json
+
+        first = client._decode_response(json.dumps({"data": [dict(sample_card_response)]}).encode())
+        second = client._decode_response(b'{"data": [], "totalCount": 0}')
+
+        card = client._parse_card(first["data"][0])
+        assert card.id == "base1-4"
+        assert card.name == "Charizard"
+        assert second == {"data": [], "totalCount": 0}
+
     def test_parse_set_info(self, client, sample_card_response):
         """Parses set information."""
         card = client._parse_card(sample_card_response)
@@ -221,6 +243,244 @@ class TestClientConfiguration:
         assert client.request_delay_ms == 500
 
 
+class TestCardQuery:
+    """Test card search query building."""
+
+    def test_build_card_query(self):
+        """Combines filters into a single Lucene query."""
+        from scrapers.pokemon_tcg_api import _build_card_query
+
+        assert _build_card_query(set_id="base1") == 'set.id:"base1"'
+        assert _build_card_query(name="Char", rarity="Rare Holo") == (
+            'name:"Char*" rarity:"Rare Holo"'
+        )
+        assert _build_card_query() is None
+
+
+class TestBulkCardLookup:
+    """Test bulk card lookup by ID."""
+
+    async def test_get_cards_fetches_each_set_once(self, client, monkeypatch):
+        """Groups IDs by set and filters to the requested cards."""
+        fetched = []
+
+        async def fake_get_all_cards_in_set(set_id):
+            fetched.append(set_id)
+            return [
+                CardData(id=f"{set_id}-{n}", name=f"Card {n}", set_id=set_id,
+                         set_name=set_id, number=str(n))
+                for n in range(1, 4)
+            ]
+
+        monkeypatch.setattr(client, "get_all_cards_in_set", fake_get_all_cards_in_set)
+
+        cards = await client.get_cards(["base1-1", "base1-3", "sv1-2", "sv1-99"])
+
+        assert sorted(fetched) == ["base1", "sv1"]
+        assert set(cards) == {"base1-1", "base1-3", "sv1-2"}
+
+
+class TestSetPagination:
+    """Test paged fetching of a whole set."""
+
+    async def test_fetches_remaining_pages_after_first(self):
+        """All pages are requested once and stitched back in order."""
+        client = PokemonTCGClient(request_delay_ms=0)
+        requested = []
+
+        async def fake_search_page(q, page, page_size):
+            requested.append(page)
+            start = (page - 1) * page_size
+            count = min(page_size, 600 - start)
+            cards = [
+                CardData(id=f"sv1-{start + n}", name="Card", set_id="sv1",
+                         set_name="Scarlet & Violet", number=str(start + n))
+                for n in range(count)
+            ]
+            return cards, 600
+
+        client._search_page = fake_search_page
+        cards = await client.get_all_cards_in_set("sv1")
+
+        assert sorted(requested) == [1, 2, 3]
+        assert len(cards) == 600
+        assert cards[250].id == "sv1-250"
+
+    async def test_single_page_set(self):
+        """Sets that fit in one page make a single request."""
+        client = PokemonTCGClient(request_delay_ms=0)
+        requested = []
+
+        async def fake_search_page(q, page, page_size):
+            requested.append(page)
+            return [], 0
+
+        client._search_page = fake_search_page
+        assert await client.get_all_cards_in_set("empty") == []
+        assert requested == [1]
+
+
+class TestResponseCache:
+    """Test the on-disk response cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored responses are returned until they expire."""
+        cache = ResponseCache(str(tmp_path / "cache.db"))
+        key = ResponseCache.make_key("/cards", {"q": 'set.id:"base1"', "page": 1})
+
+        assert cache.get(key) is None
+        cache.set(key, {"data": [], "totalCount": 0}, ttl_seconds=60)
+        assert cache.get(key) == {"data": [], "totalCount": 0}
+
+        cache.set(key, {"data": []}, ttl_seconds=-1)
+        assert cache.get(key) is None
+        cache.close()
+
+    def test_raw_body_stored_verbatim(self, tmp_path, sample_card_response):
+        """Raw response bytes are cached as-is and decoded on read."""
+        import json
+
+        cache = ResponseCache(str(tmp_path / "cache.db"))
+        key = ResponseCache.make_key("/cards/base1-4")
+        body = json.dumps({"data": dict(sample_card_response)}).encode()
+
+        cache.set(key, body, ttl_seconds=60)
+
+        row = cache._get_conn().execute("SELECT body FROM responses").fetchone()
+        assert row[0] == body
+        assert cache.get(key)["data"]["name"] == "Charizard"
+        cache.close()
+
+    def test_key_ignores_param_order(self):
+        """Cache key is independent of param ordering."""
+        a = ResponseCache.make_key("/cards", {"page": 1, "pageSize": 250})
+        b = ResponseCache.make_key("/cards", {"pageSize": 250, "page": 1})
+        assert a == b
+
+    async def test_request_served_from_cache(self, tmp_path, sample_card_response):
+        """Cached responses skip the HTTP call entirely."""
+        client = PokemonTCGClient(request_delay_ms=0, cache_path=str(tmp_path / "cache.db"))
+        client._cache.set(
+            ResponseCache.make_key("/cards/base1-4"), {"data": dict(sample_card_response)}, 60
+        )
+
+        card = await client.get_card("base1-4")
+
+        assert card.name == "Charizard"
+        assert client._pool is None
+        await client.close()
+
+    async def test_cache_io_runs_off_event_loop(self, tmp_path):
+        """Cache reads and writes happen in worker threads, not on the loop."""
+        import asyncio
+        import threading
+        import httpx
+
+        client = PokemonTCGClient(request_delay_ms=0, cache_path=str(tmp_path / "cache.db"))
+        pokemon_tcg_api._shared_pools[asyncio.get_running_loop()] = pokemon_tcg_api._SharedPool(
+            httpx.AsyncClient(
+                base_url=client.BASE_URL,
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"data": []})),
+            )
+        )
+        threads = []
+        cache_get, cache_set = client._cache.get, client._cache.set
+
+        def recording_get(*args):
+            threads.append(threading.get_ident())
+            return cache_get(*args)
+
+        def recording_set(*args):
+            threads.append(threading.get_ident())
+            return cache_set(*args)
+
+        client._cache.get = recording_get
+        client._cache.set = recording_set
+
+        await asyncio.gather(*[client._request("/sets", {"page": page}) for page in range(3)])
+        assert await client._request("/sets", {"page": 0}) == {"data": []}
+
+        assert len(threads) == 7
+        assert threading.get_ident() not in threads
+        await client.close()
+
+
+class TestRequestLimit:
+    """Test the client-wide cap on requests in flight."""
+
+    async def test_requests_share_client_slots(self):
+        """Concurrent calls never have more requests open than the limit."""
+        import asyncio
+        import httpx
+
+        running = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={"data": [], "totalCount": 0})
+
+        client = PokemonTCGClient(request_delay_ms=0, max_concurrent_requests=2)
+        pokemon_tcg_api._shared_pools[asyncio.get_running_loop()] = pokemon_tcg_api._SharedPool(
+            httpx.AsyncClient(base_url=client.BASE_URL, transport=httpx.MockTransport(handler))
+        )
+
+        await asyncio.gather(*[client._request("/cards", {"page": page}) for page in range(8)])
+
+        assert peak == 2
+        await client.close()
+
+    def test_default_limit(self):
+        """Clients default to MAX_CONCURRENT_REQUESTS slots."""
+        client = PokemonTCGClient(request_delay_ms=0)
+        assert client.max_concurrent_requests == PokemonTCGClient.MAX_CONCURRENT_REQUESTS
+
+
+class TestSharedConnectionPool:
+    """Test the HTTP client pool shared between API clients."""
+
+    async def test_close_keeps_pool_for_other_clients(self):
+        """Closing one client leaves the pool open for the rest."""
+        first = PokemonTCGClient(request_delay_ms=0)
+        second = PokemonTCGClient(request_delay_ms=0)
+
+        http = await first._get_client()
+        assert await second._get_client() is http
+
+        await first.close()
+        assert not http.is_closed
+
+        await second.close()
+        assert http.is_closed
+
+    def test_pool_per_event_loop(self):
+        """Each event loop gets its own pooled client."""
+        import asyncio
+
+        client = PokemonTCGClient(request_delay_ms=0)
+        first = asyncio.run(client._get_client())
+        second = asyncio.run(client._get_client())
+
+        assert first is not second
+
+    async def test_aclose_shared(self):
+        """aclose_shared closes the running loop's pool outright."""
+        from scrapers.pokemon_tcg_api import aclose_shared
+
+        client = PokemonTCGClient(request_delay_ms=0)
+        http = await client._get_client()
+
+        await aclose_shared()
+
+        assert http.is_closed
+        assert await client._get_client() is not http
+        await client.close()
+
+
 class TestCreateClientFactory:
     """Test factory function."""
 
@@ -265,6 +525,126 @@ class TestSyncService:
         assert service._classify_era("Scarlet & Violet", "2023/03/31") == "modern_chase"
         assert service._classify_era("Sword & Shield", "2020/02/07") == "swsh_era"
 
+    def test_classify_era_by_id(self, sample_card_response):
+        """Known set ids classify by lookup; unknown ids fall back to rules."""
+        from scrapers.sync_cards import CardSyncService, _classify_era_fast
+        service = CardSyncService()
+
+        assert _classify_era_fast("base1") == "wotc_vintage"
+        assert _classify_era_fast("neo4") == "wotc_vintage"
+        assert _classify_era_fast("swsh7") == "swsh_era"
+        assert _classify_era_fast("sv3pt5") == "modern_chase"
+        assert _classify_era_fast("xy1", "XY", "2014/02/05") == "xy_era"
+
+        card = service.client._parse_card(sample_card_response)
+        assert service.classify_all([card, card]) == ["wotc_vintage", "wotc_vintage"]
+
+    def test_classify_all_unknown_set(self, sample_card_response):
+        """Unknown set ids use synced set eras, never the set name as a series."""
+        from dataclasses import replace
+        from scrapers.sync_cards import CardSyncService
+        service = CardSyncService()
+
+        card = replace(
+            service.client._parse_card(sample_card_response),
+            set_id="xy1",
+            set_name="XY",
+        )
+        assert service.classify_all([card]) == ["other"]
+
+        service._set_eras["xy1"] = "xy_era"
+        assert service.classify_all([card]) == ["xy_era"]
+
+    async def test_concurrent_sync_set_shares_fetch(self):
+        """Overlapping syncs of the same set hit the API once."""
+        import asyncio
+        from scrapers.sync_cards import CardSyncService
+
+        class FakeClient:
+            set_calls = 0
+
+            async def get_set(self, set_id):
+                FakeClient.set_calls += 1
+                await asyncio.sleep(0)
+                return SetData(id=set_id, name="Base", series="Base", total_cards=1)
+
+            async def get_all_cards_in_set(self, set_id):
+                return []
+
+        service = CardSyncService(FakeClient())
+        first, second = await asyncio.gather(
+            service.sync_set("base1"), service.sync_set("base1")
+        )
+
+        assert FakeClient.set_calls == 1
+        assert first is second
+        assert service._inflight == {}
+
+    def test_process_card_columns(self):
+        """Processed cards transpose into parallel columns."""
+        from scrapers.sync_cards import CardSyncService, ProcessedCard, cards_to_columns
+        service = CardSyncService()
+
+        card = CardData(
+            id="base1-4", name="Charizard", set_id="base1", set_name="Base",
+            number="4", tcgplayer_market=100.0, cardmarket_trend=80.456,
+        )
+        processed = service._process_card(card)
+
+        assert isinstance(processed, ProcessedCard)
+        assert processed.market_value_nm == 79.0
+        assert processed.cardmarket_trend == 80.46
+
+        columns = cards_to_columns([processed, processed])
+        assert columns["id"] == ["base1-4", "base1-4"]
+        assert list(columns) == list(processed.to_dict())
+
+    async def test_stream_set_writes_ndjson(self, tmp_path):
+        """Streamed cards arrive at the writer as NDJSON lines."""
+        import asyncio
+        import json
+        from scrapers.sync_cards import CardSyncService, write_ndjson
+
+        class FakeClient:
+            async def get_set(self, set_id):
+                return SetData(id=set_id, name="Base", series="Base", total_cards=2)
+
+            async def get_all_cards_in_set(self, set_id):
+                return [
+                    CardData(id=f"{set_id}-{n}", name="Card", set_id=set_id,
+                             set_name="Base", number=str(n))
+                    for n in (1, 2)
+                ]
+
+        service = CardSyncService(FakeClient())
+        queue = asyncio.Queue()
+        path = tmp_path / "cards.ndjson"
+        writer = asyncio.create_task(write_ndjson(queue, str(path)))
+
+        await service.stream_set("base1", queue)
+        await queue.put(None)
+
+        assert await writer == 2
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [row["id"] for row in rows] == ["base1-1", "base1-2"]
+
+    def test_stream_cards_from_ndjson(self, tmp_path):
+        """Cards are read back one NDJSON line at a time."""
+        from scrapers.sync_cards import ProcessedCard, stream_cards
+
+        cards = [
+            ProcessedCard(
+                id=f"base1-{n}", name="Card", set_id="base1", set_name="Base",
+                number=str(n), rarity=None, image_small=None, image_large=None,
+                market_value_nm=1.5 * n, cardmarket_low=None, cardmarket_trend=None,
+            )
+            for n in (1, 2, 3)
+        ]
+        path = tmp_path / "cards.ndjson"
+        path.write_bytes(b"".join(card.to_json() for card in cards) + b"\n")
+
+        assert list(stream_cards(str(path))) == cards
+
     def test_popular_sets_defined(self):
         """Popular sets list is defined."""
         from scrapers.sync_cards import POPULAR_SETS
@@ -1,18 +1,18 @@
 """
 Tests for retail site scrapers (Magic Madhouse, Chaos Cards).
 """
+import httpx
 import pytest
 
-from scrapers.magic_madhouse import MagicMadhouseScraper
-from scrapers.chaos_cards import ChaosCardsScraper
+from scrapers.http_cache import ConditionalCache
 
 
 class TestMagicMadhouseScraper:
     """Test Magic Madhouse scraper functionality."""
 
     @pytest.fixture
-    def scraper(self):
-        return MagicMadhouseScraper(headless=True, request_delay_ms=0)
+    def scraper(self, magicmadhouse_scraper):
+        return magicmadhouse_scraper
 
     def test_base_url(self, scraper):
         """Has correct base URL."""
@@ -104,8 +104,8 @@ class TestChaosCardsScraper:
     """Test Chaos Cards scraper functionality."""
 
     @pytest.fixture
-    def scraper(self):
-        return ChaosCardsScraper(headless=True, request_delay_ms=0)
+    def scraper(self, chaoscards_scraper):
+        return chaoscards_scraper
 
     def test_base_url(self, scraper):
         """Has correct base URL."""
@@ -222,64 +222,94 @@ class TestRetailScraperFactories:
 class TestRetailListingProperties:
     """Test retail listing specific properties."""
 
-    def test_retail_condition_always_nm(self):
-        """Retail listings are always NM condition."""
-        mm = MagicMadhouseScraper()
-        cc = ChaosCardsScraper()
-
-        mm_listing = mm.parse_listing({
+    @pytest.fixture(params=[
+        ("magicmadhouse_scraper", "https://www.magicmadhouse.co.uk/products/test"),
+        ("chaoscards_scraper", "https://www.chaoscards.co.uk/products/test"),
+    ], ids=["magicmadhouse", "chaoscards"])
+    def retail_listing(self, request):
+        """A parsed in-stock listing from each retail scraper."""
+        fixture_name, url = request.param
+        scraper = request.getfixturevalue(fixture_name)
+        return scraper.parse_listing({
             "external_id": "test",
-            "url": "https://www.magicmadhouse.co.uk/products/test",
+            "url": url,
             "title": "Test",
             "price": 10.0,
             "in_stock": True,
         })
 
-        cc_listing = cc.parse_listing({
-            "external_id": "test",
-            "url": "https://www.chaoscards.co.uk/products/test",
-            "title": "Test",
-            "price": 10.0,
-            "in_stock": True,
-        })
-
-        assert mm_listing.condition == "NM"
-        assert cc_listing.condition == "NM"
+    def test_retail_condition_always_nm(self, retail_listing):
+        """Retail listings are always NM condition."""
+        assert retail_listing.condition == "NM"
 
-    def test_retail_is_buy_now(self):
+    def test_retail_is_buy_now(self, retail_listing):
         """Retail listings are always buy now."""
-        mm = MagicMadhouseScraper()
+        assert retail_listing.is_buy_now is True
 
-        listing = mm.parse_listing({
-            "external_id": "test",
-            "url": "https://www.magicmadhouse.co.uk/products/test",
-            "title": "Test",
-            "price": 10.0,
-            "in_stock": True,
-        })
+    def test_currency_is_gbp(self, retail_listing):
+        """Retail listings use GBP."""
+        assert retail_listing.currency == "GBP"
 
-        assert listing.is_buy_now is True
+    @pytest.mark.parametrize("fixture_name", ["magicmadhouse_scraper", "chaoscards_scraper"])
+    def test_shared_found_at(self, request, fixture_name):
+        """A page timestamp passed to parse_listing is used as-is."""
+        from datetime import datetime, UTC
 
-    def test_currency_is_gbp(self):
-        """Retail listings use GBP."""
-        mm = MagicMadhouseScraper()
-        cc = ChaosCardsScraper()
+        scraper = request.getfixturevalue(fixture_name)
+        found_at = datetime(2024, 1, 1, tzinfo=UTC)
+        raw = {"external_id": "test", "url": "https://example.com/p", "price": 10.0}
 
-        mm_listing = mm.parse_listing({
-            "external_id": "test",
-            "url": "https://www.magicmadhouse.co.uk/products/test",
-            "title": "Test",
-            "price": 10.0,
-            "in_stock": True,
-        })
+        assert scraper.parse_listing(raw, found_at).found_at is found_at
 
-        cc_listing = cc.parse_listing({
-            "external_id": "test",
-            "url": "https://www.chaoscards.co.uk/products/test",
-            "title": "Test",
-            "price": 10.0,
-            "in_stock": True,
-        })
 
-        assert mm_listing.currency == "GBP"
-        assert cc_listing.currency == "GBP"
+class TestConditionalCache:
+    """Test page revalidation for retail scrapers."""
+
+    async def test_unchanged_after_304(self, tmp_path):
+        """Second request sends the stored ETag and honours a 304."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'})
+
+        cache = ConditionalCache(str(tmp_path / "http.db"))
+        cache._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        url = "https://www.chaoscards.co.uk/pokemon-single-cards"
+
+        assert await cache.is_unchanged(url) is False
+        await cache.commit(url)
+        assert await cache.is_unchanged(url) is True
+        assert seen_headers == [None, '"v1"']
+        await cache.close()
+
+    async def test_validators_stored_only_on_commit(self, tmp_path):
+        """A page that was never scraped successfully is not marked unchanged."""
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'})
+
+        cache = ConditionalCache(str(tmp_path / "http.db"))
+        cache._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        url = "https://www.chaoscards.co.uk/pokemon-single-cards"
+
+        assert await cache.is_unchanged(url) is False
+        # Scrape failed: no commit
+        assert await cache.is_unchanged(url) is False
+        assert cache.get(url) is None
+
+        await cache.commit(url)
+        assert cache.get(url) == ('"v1"', None)
+        await cache.close()
+
+    def test_factory_enables_cache(self, tmp_path):
+        """Factories wire the cache only when a path is given."""
+        from scrapers.chaos_cards import create_chaoscards_scraper
+
+        assert create_chaoscards_scraper().http_cache is None
+        scraper = create_chaoscards_scraper(http_cache_path=str(tmp_path / "http.db"))
+        assert isinstance(scraper.http_cache, ConditionalCache)
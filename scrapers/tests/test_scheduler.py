@@ -0,0 +1,375 @@
+"""
+Tests for the scraper scheduler.
+
+Scrapers are replaced with in-memory fakes and the scheduler's clock with a
+manually advanced one, so scheduling decisions are deterministic.
+"""
+import asyncio
+import json
+import time
+from datetime import datetime, UTC
+
+import pytest
+
+from scrapers import scheduler as scheduler_module
+from scrapers.base import RawListing, ScraperResult
+from scrapers.proxy_manager import ProxyConfig, ProxyManager
+from scrapers.scheduler import MAX_BACKOFF_SECONDS, ScraperScheduler, ScraperTask
+
+
+class FakeClock:
+    """Stands in for the time module: monotonic() and time() advance together."""
+
+    def __init__(self):
+        self.now = 0.0
+        # Anchored to the real wall clock, since run times are stamped
+        # with datetime.now()
+        self.wall = time.time()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.wall + self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeScraper:
+    """Scraper returning canned listings, optionally slowly or with a failure."""
+
+    def __init__(self, name: str, listings: int = 1, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.listings = listings
+        self.delay = delay
+        self.fail = fail
+        self.runs = 0
+        self.closed = False
+        self.running = 0
+        self.peak = 0
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def run(self) -> ScraperResult:
+        self.runs += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+
+        if self.fail:
+            return ScraperResult(platform=self.name, success=False, listings=[], error="boom")
+        return ScraperResult(
+            platform=self.name,
+            success=True,
+            listings=[
+                RawListing(f"{self.name}-{i}", self.name, "https://x", "Card", 1.0)
+                for i in range(self.listings)
+            ],
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock with jitter disabled."""
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler_module, "time", fake)
+    monkeypatch.setattr(scheduler_module, "_jittered", lambda interval: interval)
+    return fake
+
+
+def make_scheduler(scrapers: dict, intervals: dict, state_path: str = "") -> ScraperScheduler:
+    """Build a scheduler whose only tasks run the given fake scrapers."""
+    sched = ScraperScheduler(
+        proxy_manager=ProxyManager(ProxyConfig(enabled=False)),
+        state_path=state_path,
+    )
+    sched.tasks = {
+        name: ScraperTask(
+            name=name,
+            interval_seconds=intervals[name],
+            factory=lambda scraper=scraper: scraper,
+        )
+        for name, scraper in scrapers.items()
+    }
+    sched._heap.clear()
+    sched._generations.clear()
+    sched._load_state()
+    for task in sched.tasks.values():
+        sched._reschedule(task)
+    return sched
+
+
+class TestScheduling:
+    """Test the timer heap: due ordering and rescheduling."""
+
+    async def test_never_run_tasks_are_due_immediately(self, clock):
+        """Tasks with no history all run on the first pass."""
+        a, b = FakeScraper("a"), FakeScraper("b")
+        sched = make_scheduler({"a": a, "b": b}, {"a": 60, "b": 30})
+
+        results = await sched.run_all_due()
+
+        assert sorted(r.platform for r in results) == ["a", "b"]
+        assert (a.runs, b.runs) == (1, 1)
+
+    async def test_rescheduled_one_interval_after_run(self, clock):
+        """Only tasks whose interval has elapsed run again, earliest first."""
+        a, b = FakeScraper("a"), FakeScraper("b")
+        sched = make_scheduler({"a": a, "b": b}, {"a": 60, "b": 30})
+        await sched.run_all_due()
+
+        assert sched._next_due() == 30
+
+        clock.advance(31)
+        results = await sched.run_all_due()
+
+        assert [r.platform for r in results] == ["b"]
+        assert (a.runs, b.runs) == (1, 2)
+        assert sched._next_due() == 60
+
+    async def test_nothing_due_runs_nothing(self, clock):
+        """A pass before any fire time does no work."""
+        a = FakeScraper("a")
+        sched = make_scheduler({"a": a}, {"a": 60})
+        await sched.run_all_due()
+
+        clock.advance(10)
+        assert await sched.run_all_due() == []
+        assert a.runs == 1
+
+    async def test_disabled_task_entries_are_skipped(self, clock):
+        """Disabling a task drops its pending heap entry."""
+        a = FakeScraper("a")
+        sched = make_scheduler({"a": a}, {"a": 60})
+
+        sched.disable_task("a")
+
+        assert sched._next_due() is None
+        assert await sched.run_all_due() == []
+
+    async def test_set_interval_supersedes_old_entry(self, clock):
+        """Changing an interval reschedules from the last run."""
+        a = FakeScraper("a")
+        sched = make_scheduler({"a": a}, {"a": 60})
+        await sched.run_all_due()
+
+        sched.set_interval("a", 300)
+
+        assert sched._next_due() == 300
+
+
+    @pytest.mark.parametrize("change", [
+        lambda sched: sched.set_interval("a", 300),
+        lambda sched: sched.enable_task("a"),
+    ], ids=["set_interval", "enable_task"])
+    async def test_changes_during_run_wait_for_it_to_finish(self, clock, change):
+        """A running task isn't queued again until its run ends."""
+        scraper = FakeScraper("a", delay=0.05)
+        sched = make_scheduler({"a": scraper}, {"a": 300})
+
+        run = asyncio.create_task(sched.run_all_due())
+        while scraper.running == 0:
+            await asyncio.sleep(0)
+
+        change(sched)
+        assert sched._next_due() is None
+        assert await sched.run_all_due() == []
+
+        await run
+        assert scraper.runs == 1
+        assert sched._next_due() == 300
+
+
+class TestConcurrencyAndTimeouts:
+    """Test the concurrency cap and per-run timeout."""
+
+    async def test_concurrency_cap(self, clock):
+        """No more than the semaphore's limit of scrapers run at once."""
+        shared = FakeScraper("shared", delay=0.01)
+        sched = make_scheduler({n: shared for n in "abcd"}, {n: 60 for n in "abcd"})
+        sched._run_sem = asyncio.Semaphore(2)
+
+        results = await sched.run_all_due()
+
+        assert len(results) == 4
+        assert shared.peak == 2
+
+    async def test_timeout_fails_run_and_drops_instance(self, clock):
+        """A run past 90% of its interval fails and its scraper is closed."""
+        slow = FakeScraper("slow", delay=1.0)
+        sched = make_scheduler({"slow": slow}, {"slow": 0.05})
+
+        [result] = await sched.run_all_due()
+
+        assert result.success is False
+        assert result.error == "timeout"
+        assert slow.closed is True
+        assert sched.tasks["slow"].instance is None
+        assert sched.tasks["slow"].consecutive_failures == 1
+
+
+class TestBackoff:
+    """Test interval backoff after unproductive runs."""
+
+    def test_backoff_doubles_and_caps(self):
+        """Effective interval doubles per failure, for at most five doublings."""
+        task = ScraperTask(name="a", interval_seconds=60)
+        intervals = []
+        for failures in range(8):
+            task.consecutive_failures = failures
+            intervals.append(ScraperScheduler._effective_interval(task))
+
+        assert intervals == [60, 120, 240, 480, 960, 1920, 1920, 1920]
+
+    def test_backoff_capped_at_max(self):
+        """Long intervals stop backing off at MAX_BACKOFF_SECONDS."""
+        task = ScraperTask(name="a", interval_seconds=300, consecutive_failures=4)
+
+        assert ScraperScheduler._effective_interval(task) == MAX_BACKOFF_SECONDS
+
+    def test_backoff_never_shortens_interval(self):
+        """Intervals already above the cap are left as they are."""
+        task = ScraperTask(name="a", interval_seconds=7200, consecutive_failures=3)
+
+        assert ScraperScheduler._effective_interval(task) == 7200
+
+    async def test_failures_push_next_run_back(self, clock):
+        """Each failed run doubles the wait; a productive run resets it."""
+        scraper = FakeScraper("a", fail=True)
+        sched = make_scheduler({"a": scraper}, {"a": 60})
+
+        await sched.run_all_due()
+        assert sched._next_due() == 120
+
+        clock.advance(120)
+        await sched.run_all_due()
+        assert sched._next_due() == 120 + 240
+
+        scraper.fail = False
+        clock.advance(240)
+        await sched.run_all_due()
+        assert sched.tasks["a"].consecutive_failures == 0
+        assert sched._next_due() == 360 + 60
+
+    async def test_empty_run_backs_off_one_step(self, clock):
+        """A successful run with no listings waits one doubled interval."""
+        sched = make_scheduler({"a": FakeScraper("a", listings=0)}, {"a": 60})
+
+        await sched.run_all_due()
+        clock.advance(120)
+        await sched.run_all_due()
+
+        assert sched.tasks["a"].consecutive_failures == 1
+        assert sched._next_due() == 240
+
+
+class TestStatePersistence:
+    """Test last-run times surviving a restart."""
+
+    async def test_state_round_trip(self, clock, tmp_path):
+        """A restarted scheduler resumes the saved cadence."""
+        path = str(tmp_path / "state.json")
+        first = make_scheduler({"a": FakeScraper("a")}, {"a": 60}, state_path=path)
+        await first.run_all_due()
+
+        with open(path) as f:
+            saved = json.load(f)
+        assert saved["a"] == pytest.approx(clock.time(), abs=1)
+
+        clock.advance(20)
+        second = make_scheduler({"a": FakeScraper("a")}, {"a": 60}, state_path=path)
+
+        assert second.tasks["a"].last_run == datetime.fromtimestamp(saved["a"], UTC)
+        assert second._next_due() == pytest.approx(60, abs=1)
+        assert await second.run_all_due() == []
+
+    async def test_no_state_path_writes_nothing(self, clock, tmp_path, monkeypatch):
+        """Persistence is off unless a path is configured."""
+        monkeypatch.chdir(tmp_path)
+        sched = make_scheduler({"a": FakeScraper("a")}, {"a": 60})
+
+        await sched.run_all_due()
+
+        assert sched.state_path == ""
+        assert list(tmp_path.iterdir()) == []
+
+    def test_optional_stores_off_by_default(self, monkeypatch):
+        """Without env settings, neither state nor the HTTP cache touch disk."""
+        monkeypatch.delenv("SCRAPER_STATE_PATH", raising=False)
+        monkeypatch.delenv("SCRAPER_HTTP_CACHE_PATH", raising=False)
+        scheduler_module._load_env.cache_clear()
+        try:
+            env = scheduler_module._load_env()
+        finally:
+            scheduler_module._load_env.cache_clear()
+
+        assert env.state_path == ""
+        assert env.http_cache_path == ""
+
+    def test_unreadable_state_ignored(self, clock, tmp_path):
+        """A corrupt state file leaves tasks due immediately."""
+        path = tmp_path / "state.json"
+        path.write_text("{not json")
+
+        sched = make_scheduler({"a": FakeScraper("a")}, {"a": 60}, state_path=str(path))
+
+        assert sched.tasks["a"].last_run is None
+        assert sched._next_due() == 0
+
+
+class TestStreamingAndStop:
+    """Test result streaming, stop() and the main loop."""
+
+    async def test_listings_handed_over_per_scraper(self, clock):
+        """on_listings_found is called once per finished scraper."""
+        batches = []
+        sched = make_scheduler(
+            {"a": FakeScraper("a", listings=2), "b": FakeScraper("b", listings=3)},
+            {"a": 60, "b": 60},
+        )
+        sched.on_listings_found = batches.append
+
+        await sched.run_all_due()
+
+        assert sorted(len(batch) for batch in batches) == [2, 3]
+        assert sched.stats.total_listings == 5
+
+    async def test_stop_cancels_in_flight_runs(self, clock):
+        """stop() cancels running scrapers and closes their instances."""
+        slow = FakeScraper("slow", delay=10)
+        sched = make_scheduler({"slow": slow}, {"slow": 60})
+
+        run = asyncio.create_task(sched.run_all_due())
+        while slow.running == 0:
+            await asyncio.sleep(0)
+
+        sched.stop()
+        results = await asyncio.wait_for(run, timeout=1)
+
+        assert results == []
+        assert slow.closed is True
+        assert sched.tasks["slow"].instance is None
+
+    async def test_start_runs_due_tasks_until_stopped(self, clock):
+        """The loop runs due work and exits promptly on stop()."""
+        scraper = FakeScraper("a")
+        sched = make_scheduler({"a": scraper}, {"a": 60})
+
+        loop = asyncio.create_task(sched.start(check_interval=5))
+        while sched.tasks["a"].last_result is None:
+            await asyncio.sleep(0)
+
+        sched.stop()
+        await asyncio.wait_for(loop, timeout=1)
+
+        assert scraper.runs == 1
+        assert sched.running is False
+        assert scraper.closed is True
@@ -10,16 +10,76 @@ Target keywords:
 - "Pokemon Card Lot"
 - "Vintage Pokemon"
 """
+import asyncio
 import re
 from datetime import datetime, UTC
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
-from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE
-from .base import RawListing
+import httpx
+
+from .playwright_base import PlaywrightScraper, PLAYWRIGHT_AVAILABLE, USER_AGENT
+from .base import DEFAULT_SHIPPING_COST, RawListing
+from .json_utils import loads
 
 if PLAYWRIGHT_AVAILABLE:
-    from playwright.async_api import Page
+    from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+
+# Currency symbols and whitespace (including the non-breaking spaces Vinted
+# puts before "€") deleted before float conversion, in one translate pass
+_STRIP_TABLE = str.maketrans('', '', '£€$ \t\n\r\f\v\xa0\u202f')
+# Numeric item id in listing URLs like /items/123456-pokemon-lot
+_ITEM_ID_RE = re.compile(r'/items/(\d+)')
+
+_GRID_ITEM_SELECTOR = "[data-testid='grid-item'], .feed-grid__item"
+
+# Runs in the page: collects the fields of every grid item not yet seen,
+# in one call
+_EXTRACT_ITEMS_JS = """
+({selector, seen}) => {
+    const seenIds = new Set(seen);
+    return [...document.querySelectorAll(selector)].map(el => {
+        const link = el.querySelector("a[href*='/items/']");
+        if (!link) return null;
+        const href = link.getAttribute("href");
+        const idMatch = href && href.match(/\\/items\\/(\\d+)/);
+        if (idMatch && seenIds.has(idMatch[1])) return null;
+        const title = el.querySelector("[data-testid$='-title'], .web_ui__Text__subtitle");
+        const price = el.querySelector("[data-testid$='-price'], .web_ui__Text__bold");
+        const image = el.querySelector("img");
+        const seller = el.querySelector("[data-testid*='owner'], .web_ui__Cell__subtitle");
+        return {
+            href: href,
+            title: title ? title.innerText : "",
+            price: price ? price.innerText : null,
+            image: image ? image.getAttribute("src") : null,
+            seller: seller ? seller.innerText : null,
+        };
+    }).filter(Boolean);
+}
+"""
+
+
+# Listing pages repeat the same price strings, so parsed values are memoized
+@lru_cache(maxsize=1024)
+def _parse_price_text(price_text: Optional[str]) -> Optional[float]:
+    """Parse price from Vinted format like '£15.00'."""
+    if not price_text:
+        return None
+
+    # Remove currency symbols and whitespace
+    cleaned = price_text.translate(_STRIP_TABLE)
+
+    # Handle comma as decimal (European format)
+    if ',' in cleaned and '.' not in cleaned:
+        cleaned = cleaned.replace(',', '.')
+
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
 
 
 class VintedScraper(PlaywrightScraper):
@@ -32,9 +92,12 @@ class VintedScraper(PlaywrightScraper):
 
     BASE_URL = "https://www.vinted.co.uk"
     SEARCH_URL = f"{BASE_URL}/catalog"
+    # JSON API behind the catalog grid; tried before the browser
+    API_URL = f"{BASE_URL}/api/v2/catalog/items"
+    API_PAGE_SIZE = 96
 
     # Keywords likely to yield good bundle deals
-    BUNDLE_KEYWORDS = [
+    BUNDLE_KEYWORDS = (
         "old pokemon cards",
         "pokemon card collection",
         "pokemon binder",
@@ -47,7 +110,21 @@ class VintedScraper(PlaywrightScraper):
         "1st edition pokemon",
         "base set pokemon",
         "pokemon card binder",
-    ]
+    )
+    # fetch_listings defaults: top keywords and price range
+    DEFAULT_KEYWORD_COUNT = 5
+    DEFAULT_MIN_PRICE = 5.0
+    DEFAULT_MAX_PRICE = 500.0
+    # (keyword, search URL) for BUNDLE_KEYWORDS at the default prices;
+    # filled in below the class body
+    _DEFAULT_URLS: tuple[tuple[str, str], ...] = ()
+
+    # Keyword searches run at once, each on its own page
+    SEARCH_CONCURRENCY = 3
+
+    # Only the JS-rendered grid is read; image URLs come from attributes
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "facebook", "doubleclick")
 
     def __init__(
         self,
@@ -56,6 +133,7 @@ class VintedScraper(PlaywrightScraper):
         request_delay_ms: int = 3000,
         max_retries: int = 3,
         screenshot_dir: Optional[str] = None,
+        keep_raw: bool = False,
     ):
         super().__init__(
             name="vinted",
@@ -65,44 +143,81 @@ class VintedScraper(PlaywrightScraper):
             max_retries=max_retries,
             screenshot_dir=screenshot_dir,
         )
+        # Raw scraped dicts duplicate the listing fields, so they're only
+        # kept on RawListing.raw_data when asked for
+        self.keep_raw = keep_raw
 
-    def _build_search_url(
-        self,
-        query: str,
+        # Consent is stored as a cookie, so popups only need handling once
+        # per browser context
+        self._popups_handled = False
+
+        self._client: Optional[httpx.AsyncClient] = None
+        # Set once the home page has issued the session cookies the API needs
+        self._api_session_ready = False
+
+    @staticmethod
+    def _build_filter_query(
         min_price: float = 5.0,
         max_price: float = 500.0,
         sort: str = "newest_first",
     ) -> str:
-        """Build Vinted search URL."""
+        """Encode the search filters, which every keyword in a run shares."""
         params = {
-            "search_text": query,
             "price_from": int(min_price),
             "price_to": int(max_price),
             "order": sort,
             "catalog[]": "1918",  # Games & Consoles category
         }
 
-        return f"{self.SEARCH_URL}?{urlencode(params, doseq=True)}"
+        return urlencode(params, doseq=True)
+
+    def _build_api_params(self, min_price: float = 5.0, max_price: float = 500.0) -> dict:
+        """Catalog API filters equivalent to _build_filter_query."""
+        return {
+            "price_from": int(min_price),
+            "price_to": int(max_price),
+            "order": "newest_first",
+            "catalog_ids": "1918",  # Games & Consoles category
+            "per_page": self.API_PAGE_SIZE,
+        }
+
+    @classmethod
+    def _search_url(cls, query: str, filter_query: str) -> str:
+        """Join a keyword onto a pre-encoded filter query."""
+        return f"{cls.SEARCH_URL}?search_text={quote_plus(query)}&{filter_query}"
 
-    async def _extract_listings_from_page(self, page: Page) -> list[dict]:
-        """Extract listing data from Vinted search results."""
+    def _build_search_url(
+        self,
+        query: str,
+        min_price: float = 5.0,
+        max_price: float = 500.0,
+        sort: str = "newest_first",
+    ) -> str:
+        """Build Vinted search URL."""
+        return self._search_url(query, self._build_filter_query(min_price, max_price, sort))
+
+    async def _extract_listings_from_page(
+        self, page: Page, seen_ids: Optional[set[str]] = None
+    ) -> list[dict]:
+        """
+        Extract listing data from Vinted search results.
+
+        Grid items whose item id is in seen_ids are skipped in the browser,
+        so scrolling only returns newly loaded items.
+        """
         listings = []
 
         try:
-            # Wait for grid items to load
-            await page.wait_for_selector("[data-testid='grid-item'], .feed-grid__item", timeout=15000)
-
-            # Get all listing items
-            items = await page.query_selector_all("[data-testid='grid-item'], .feed-grid__item")
+            # Read every grid item in one round-trip to the browser
+            items = await page.evaluate(
+                _EXTRACT_ITEMS_JS,
+                {"selector": _GRID_ITEM_SELECTOR, "seen": list(seen_ids or ())},
+            )
 
             for item in items:
-                try:
-                    listing = await self._extract_item_data(item)
-                    if listing:
-                        listings.append(listing)
-                except Exception as e:
-                    self.logger.debug(f"Failed to extract item: {e}")
-                    continue
+                listing = self._build_item(item)
+                if listing:
+                    listings.append(listing)
 
         except Exception as e:
             self.logger.warning(f"Failed to extract listings: {e}")
@@ -110,83 +225,67 @@ class VintedScraper(PlaywrightScraper):
 
         return listings
 
-    async def _extract_item_data(self, item) -> Optional[dict]:
-        """Extract data from a single Vinted listing item."""
-        try:
-            # Get link and item URL
-            link_el = await item.query_selector("a[href*='/items/']")
-            if not link_el:
-                return None
-
-            href = await link_el.get_attribute("href")
-            if not href:
-                return None
-
-            # Get title
-            title_el = await item.query_selector("[data-testid$='-title'], .web_ui__Text__subtitle")
-            title = ""
-            if title_el:
-                title = await title_el.inner_text()
-
-            # Get price
-            price_el = await item.query_selector("[data-testid$='-price'], .web_ui__Text__bold")
-            price = None
-            if price_el:
-                price_text = await price_el.inner_text()
-                price = self._parse_price(price_text)
-
-            if price is None:
-                return None
+    def _build_item(self, item: dict) -> Optional[dict]:
+        """Turn one grid item read by _EXTRACT_ITEMS_JS into raw listing data."""
+        href = item.get("href")
+        if not href:
+            return None
 
-            # Get image
-            image_el = await item.query_selector("img")
-            image_url = None
-            if image_el:
-                image_url = await image_el.get_attribute("src")
+        price = self._parse_price(item.get("price"))
+        if price is None:
+            return None
 
-            # Get seller (if visible)
-            seller_el = await item.query_selector("[data-testid*='owner'], .web_ui__Cell__subtitle")
-            seller_name = None
-            if seller_el:
-                seller_name = await seller_el.inner_text()
-
-            # Extract item ID from URL
-            item_id = ""
-            id_match = re.search(r'/items/(\d+)', href)
-            if id_match:
-                item_id = id_match.group(1)
-
-            return {
-                "external_id": item_id,
-                "url": f"{self.BASE_URL}{href}" if not href.startswith("http") else href,
-                "title": title.strip(),
-                "price": price,
-                "seller_name": seller_name.strip() if seller_name else None,
-                "image_url": image_url,
-            }
+        # Extract item ID from URL
+        item_id = ""
+        id_match = _ITEM_ID_RE.search(href)
+        if id_match:
+            item_id = id_match.group(1)
+
+        seller_name = item.get("seller")
+
+        return {
+            "external_id": item_id,
+            "url": f"{self.BASE_URL}{href}" if not href.startswith("http") else href,
+            "title": (item.get("title") or "").strip(),
+            "price": price,
+            "seller_name": seller_name.strip() if seller_name else None,
+            "image_url": item.get("image"),
+        }
 
-        except Exception as e:
-            self.logger.debug(f"Item extraction error: {e}")
+    def _build_api_item(self, item: dict) -> Optional[dict]:
+        """Turn one catalog API item into raw listing data."""
+        item_id = item.get("id")
+        if not item_id:
             return None
 
-    def _parse_price(self, price_text: str) -> Optional[float]:
-        """Parse price from Vinted format like '£15.00'."""
-        if not price_text:
+        # Price is {"amount": "15.0", "currency_code": "GBP"} on current
+        # API versions and a bare string on older ones
+        price = item.get("price")
+        if isinstance(price, dict):
+            price = price.get("amount")
+        price = self._parse_price(str(price)) if price is not None else None
+        if price is None:
             return None
 
-        # Remove currency symbols and whitespace
-        cleaned = re.sub(r'[£€$\s]', '', price_text)
+        photo = item.get("photo") or {}
+        user = item.get("user") or {}
 
-        # Handle comma as decimal (European format)
-        if ',' in cleaned and '.' not in cleaned:
-            cleaned = cleaned.replace(',', '.')
+        return {
+            "external_id": str(item_id),
+            "url": item.get("url") or f"{self.BASE_URL}/items/{item_id}",
+            "title": (item.get("title") or "").strip(),
+            "price": price,
+            "seller_name": user.get("login"),
+            "image_url": photo.get("url"),
+        }
 
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+    def _parse_price(self, price_text: str) -> Optional[float]:
+        """Parse price from Vinted format like '£15.00'."""
+        return _parse_price_text(price_text)
 
-    def parse_listing(self, raw_data: dict) -> Optional[RawListing]:
+    def parse_listing(
+        self, raw_data: dict, found_at: Optional[datetime] = None
+    ) -> Optional[RawListing]:
         """Convert raw scraped data to RawListing."""
         try:
             external_id = raw_data.get("external_id", "")
@@ -202,12 +301,13 @@ class VintedScraper(PlaywrightScraper):
                 title=raw_data.get("title", "Unknown"),
                 listing_price=raw_data.get("price", 0),
                 currency="GBP",
-                shipping_cost=2.50,  # Typical Vinted UK shipping
+                shipping_cost=DEFAULT_SHIPPING_COST["vinted"],
                 condition=None,  # Vinted doesn't have standard conditions
                 seller_name=raw_data.get("seller_name"),
                 image_url=raw_data.get("image_url"),
                 is_buy_now=True,
-                raw_data=raw_data,
+                found_at=found_at or datetime.now(UTC),
+                raw_data=raw_data if self.keep_raw else {},
             )
 
         except Exception as e:
@@ -216,6 +316,9 @@ class VintedScraper(PlaywrightScraper):
 
     async def _handle_popups(self, page: Page) -> None:
         """Handle Vinted cookie consent and other popups."""
+        if self._popups_handled:
+            return
+
         try:
             # Cookie consent
             cookie_btn = await page.query_selector("#onetrust-accept-btn-handler, [data-testid='cookie-accept']")
@@ -231,6 +334,8 @@ class VintedScraper(PlaywrightScraper):
                 except Exception:
                     pass
 
+            self._popups_handled = True
+
         except Exception as e:
             self.logger.debug(f"Popup handling: {e}")
 
@@ -240,6 +345,7 @@ class VintedScraper(PlaywrightScraper):
         min_price: float = 5.0,
         max_price: float = 500.0,
         max_scroll: int = 5,
+        max_api_pages: int = 5,
     ) -> list[RawListing]:
         """
         Fetch Pokemon card listings from Vinted UK.
@@ -248,7 +354,8 @@ class VintedScraper(PlaywrightScraper):
             search_terms: Search keywords (uses BUNDLE_KEYWORDS if None)
             min_price: Minimum price in GBP
             max_price: Maximum price in GBP
-            max_scroll: Maximum scroll iterations per search
+            max_scroll: Maximum scroll iterations per browser search
+            max_api_pages: Maximum catalog API pages per search
 
         Returns:
             List of RawListing objects
@@ -257,59 +364,188 @@ class VintedScraper(PlaywrightScraper):
             self.logger.error("Playwright not available")
             return []
 
+        if not search_terms and (min_price, max_price) == (
+            self.DEFAULT_MIN_PRICE, self.DEFAULT_MAX_PRICE
+        ):
+            searches = self._DEFAULT_URLS[:self.DEFAULT_KEYWORD_COUNT]
+        else:
+            terms = search_terms or self.BUNDLE_KEYWORDS[:self.DEFAULT_KEYWORD_COUNT]
+            filter_query = self._build_filter_query(min_price, max_price)
+            searches = [(term, self._search_url(term, filter_query)) for term in terms]
+
+        api_params = self._build_api_params(min_price, max_price)
+        sem = asyncio.Semaphore(self.SEARCH_CONCURRENCY)
+
+        async def search_one(term: str, url: str) -> list[RawListing]:
+            async with sem:
+                # Plain HTTP first; the browser handles anti-bot challenges.
+                # Each search falls back on its own, so one refused request
+                # doesn't move the other keywords to the browser.
+                listings = await self._search_api(term, api_params, max_api_pages)
+                if listings is not None:
+                    return listings
+                return await self._search_term(term, url, max_scroll)
+
+        # The browser stays up between runs; close() (or leaving an
+        # ``async with`` block) shuts it down
+        results = await asyncio.gather(*[search_one(term, url) for term, url in searches])
+
         all_listings: dict[str, RawListing] = {}
-        terms = search_terms or self.BUNDLE_KEYWORDS[:5]  # Use top 5 by default
+        for listings in results:
+            for listing in listings:
+                all_listings.setdefault(listing.external_id, listing)
 
-        try:
-            page = await self._get_page()
+        self.logger.info(f"Found {len(all_listings)} Vinted listings")
+        return list(all_listings.values())
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client used for the catalog API."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                proxy=self.proxy_url or None,
+                timeout=15.0,
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept": "application/json, text/plain, */*",
+                    "Accept-Language": "en-GB,en;q=0.9",
+                },
+            )
+        return self._client
+
+    async def _search_api(
+        self,
+        term: str,
+        api_params: dict,
+        max_pages: int,
+    ) -> Optional[list[RawListing]]:
+        """
+        Run one keyword search against the catalog JSON API.
+
+        Returns None when the API refuses the request, so the caller can
+        fall back to the browser.
+        """
+        self.logger.info(f"Searching Vinted API: '{term}'")
 
-            for term in terms:
-                self.logger.info(f"Searching Vinted: '{term}'")
+        client = self._get_client()
+        listings: dict[str, RawListing] = {}
+        seen_ids: set[int] = set()
 
-                url = self._build_search_url(
-                    query=term,
-                    min_price=min_price,
-                    max_price=max_price,
+        try:
+            if not self._api_session_ready:
+                # The API rejects requests without the home page's cookies
+                response = await client.get(self.BASE_URL)
+                response.raise_for_status()
+                self._api_session_ready = True
+
+            for page_num in range(1, max_pages + 1):
+                if page_num > 1:
+                    await self.delay()
+
+                response = await client.get(
+                    self.API_URL,
+                    params={**api_params, "search_text": term, "page": page_num},
                 )
+                response.raise_for_status()
+                data = loads(response.content)
+                if not isinstance(data, dict):
+                    raise ValueError("unexpected catalog response")
+                items = data.get("items") or []
+
+                found_at = datetime.now(UTC)
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    # Skip repeats across pages before building anything
+                    item_id = item.get("id")
+                    if not item_id or item_id in seen_ids:
+                        continue
+                    seen_ids.add(item_id)
+                    raw = self._build_api_item(item)
+                    listing = self.parse_listing(raw, found_at) if raw else None
+                    if listing:
+                        listings[listing.external_id] = listing
 
-                try:
-                    await page.goto(url, wait_until="domcontentloaded")
-                    await self._handle_popups(page)
+                if len(items) < self.API_PAGE_SIZE:
+                    break
 
-                    # Wait for initial content
-                    await page.wait_for_load_state("networkidle", timeout=10000)
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.info(f"Vinted API unavailable for '{term}', using browser: {e}")
+            return None
 
-                    # Scroll to load more items (Vinted uses infinite scroll)
-                    for scroll_num in range(max_scroll):
-                        # Extract current listings
-                        raw_listings = await self._extract_listings_from_page(page)
+        return list(listings.values())
 
-                        for raw in raw_listings:
-                            listing = self.parse_listing(raw)
-                            if listing and listing.external_id not in all_listings:
-                                all_listings[listing.external_id] = listing
+    async def _search_term(
+        self,
+        term: str,
+        url: str,
+        max_scroll: int,
+    ) -> list[RawListing]:
+        """Run one keyword search on its own page, scrolling the results."""
+        self.logger.info(f"Searching Vinted: '{term}'")
 
-                        # Scroll down to trigger loading
-                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        await self.delay()
+        listings: dict[str, RawListing] = {}
+        seen_ids: set[str] = set()
 
-                        # Check if we've hit the end
-                        end_marker = await page.query_selector("[data-testid='catalog-end'], .feed-grid__end")
-                        if end_marker:
-                            break
+        page = await self._get_page()
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+            await self._handle_popups(page)
 
-                except Exception as e:
-                    self.logger.error(f"Search failed for '{term}': {e}")
-                    await self._take_screenshot(page, f"vinted_error_{term[:10]}")
-                    continue
+            # Wait for the grid itself; tracking requests keep the network
+            # from ever going idle. A search with no matches never renders
+            # the grid, so a timeout here just means no results.
+            try:
+                await page.wait_for_selector(_GRID_ITEM_SELECTOR, timeout=10000)
+            except PlaywrightTimeoutError:
+                self.logger.info(f"No Vinted results for '{term}'")
+                return []
+
+            # Scroll to load more items (Vinted uses infinite scroll)
+            for scroll_num in range(max_scroll):
+                # Extract listings loaded since the last scroll
+                raw_listings = await self._extract_listings_from_page(page, seen_ids)
+
+                found_at = datetime.now(UTC)
+                for raw in raw_listings:
+                    item_id = raw["external_id"]
+                    if not item_id or item_id in seen_ids:
+                        continue
+                    seen_ids.add(item_id)
+                    listing = self.parse_listing(raw, found_at)
+                    if listing:
+                        listings[listing.external_id] = listing
 
+                # Scroll down to trigger loading
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                 await self.delay()
 
+                # Check if we've hit the end
+                end_marker = await page.query_selector("[data-testid='catalog-end'], .feed-grid__end")
+                if end_marker:
+                    break
+
+        except Exception as e:
+            self.logger.error(f"Search failed for '{term}': {e}")
+            await self._take_screenshot(page, f"vinted_error_{term[:10]}")
+
         finally:
-            await self.close()
+            await page.close()
 
-        self.logger.info(f"Found {len(all_listings)} Vinted listings")
-        return list(all_listings.values())
+        return list(listings.values())
+
+    async def close(self) -> None:
+        """Close the browser and API client; a new context will show the popups again."""
+        self._popups_handled = False
+        self._api_session_ready = False
+
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+        await super().close()
 
     async def fetch_listing_details(self, listing_url: str) -> Optional[dict]:
         """
@@ -321,6 +557,7 @@ class VintedScraper(PlaywrightScraper):
         if not self.is_configured():
             return None
 
+        page = None
         try:
             page = await self._get_page()
             await page.goto(listing_url, wait_until="domcontentloaded")
@@ -357,7 +594,16 @@ class VintedScraper(PlaywrightScraper):
             return None
 
         finally:
-            await self.close()
+            if page:
+                await page.close()
+
+
+VintedScraper._DEFAULT_URLS = tuple(
+    (term, VintedScraper._search_url(term, VintedScraper._build_filter_query(
+        VintedScraper.DEFAULT_MIN_PRICE, VintedScraper.DEFAULT_MAX_PRICE
+    )))
+    for term in VintedScraper.BUNDLE_KEYWORDS
+)
 
 
 def create_vinted_scraper(
@@ -6,7 +6,9 @@ Run this to check if your development environment is properly configured.
 Usage:
     python scripts/check_env.py
 """
+import json
 import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -14,9 +16,39 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(project_root / "backend"))
 
+# A broken backend install is one of the things this script reports,
+# so an import failure is kept for main() rather than raised here
+try:
+    from config import get_settings
+    settings_import_error = None
+except Exception as e:
+    get_settings = None
+    settings_import_error = e
+
 def check_mark(ok: bool) -> str:
     return "OK" if ok else "MISSING"
 
+def running_containers(output: str) -> set[str]:
+    """
+    Names of running containers in `docker compose ps --format json` output.
+
+    Newer Compose prints one JSON object per line, older versions a single
+    JSON array; both are accepted.
+    """
+    output = output.strip()
+    if not output:
+        return set()
+
+    if output.startswith("["):
+        containers = json.loads(output)
+    else:
+        containers = [json.loads(line) for line in output.splitlines() if line.strip()]
+
+    return {
+        c["Name"] for c in containers
+        if c.get("State", "running") == "running"
+    }
+
 def main():
     print("=" * 50)
     print("PokeUK DealScout - Environment Check")
@@ -33,7 +65,8 @@ def main():
 
     # Load settings
     try:
-        from config import get_settings
+        if settings_import_error:
+            raise settings_import_error
         settings = get_settings()
         print("[OK] Settings loaded")
     except Exception as e:
@@ -50,34 +83,38 @@ def main():
         print(f"  Redis: {settings.redis_url}")
 
     # Check Docker
-    import subprocess
+    docker_installed = True
     try:
         result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
         print(f"\n[OK] Docker: {result.stdout.strip()}")
     except FileNotFoundError:
+        docker_installed = False
         print("\n[MISSING] Docker not installed")
         issues.append("Install Docker: https://docs.docker.com/get-docker/")
 
-    # Check if containers are running
-    try:
-        result = subprocess.run(
-            ["docker", "compose", "ps", "--format", "json"],
-            capture_output=True,
-            text=True,
-            cwd=project_root
-        )
-        if "pokeuk_postgres" in result.stdout:
-            print("[OK] PostgreSQL container running")
-        else:
-            print("[STOPPED] PostgreSQL container")
-            issues.append("Start containers: make db-up (or docker compose up -d)")
-
-        if "pokeuk_redis" in result.stdout:
-            print("[OK] Redis container running")
-        else:
-            print("[STOPPED] Redis container")
-    except Exception:
-        pass
+    # Check if containers are running (one compose call covers both)
+    if docker_installed:
+        try:
+            result = subprocess.run(
+                ["docker", "compose", "ps", "--format", "json", "--filter", "name=pokeuk_"],
+                capture_output=True,
+                text=True,
+                cwd=project_root
+            )
+            running = running_containers(result.stdout)
+
+            if "pokeuk_postgres" in running:
+                print("[OK] PostgreSQL container running")
+            else:
+                print("[STOPPED] PostgreSQL container")
+                issues.append("Start containers: make db-up (or docker compose up -d)")
+
+            if "pokeuk_redis" in running:
+                print("[OK] Redis container running")
+            else:
+                print("[STOPPED] Redis container")
+        except Exception:
+            pass
 
     print()
     print("API Credentials:")